@@ -1,3 +1,10 @@
 from .auction_information import *
 from .day_simulation import *
-from .simulation_engine import *
\ No newline at end of file
+from .simulation_engine import *
+from .strategy_profile import *
+from .forecast_error_sampler import *
+from .random_streams import *
+from .utility_cache import *
+from .utility_accumulator import *
+from .clearing_kernel import *
+from .generator_portfolio import *
\ No newline at end of file
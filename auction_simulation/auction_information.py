@@ -1,14 +1,15 @@
 import numpy as np
-import polars as pl
-import constants as ct
+import auction_simulation.clearing_kernel as clearing_kernel
 
 class AuctionInformation:
+    #Bids and capacities are (periods x generators) arrays, with periods in ascending delivery period order
+    #and generator i in column i
     def __init__(
         self, 
         actual_domestic_prices : np.ndarray, 
         actual_foreign_prices : np.ndarray,
-        bids_by_generator_by_period : pl.DataFrame,
-        capacity_by_generator_by_period : pl.DataFrame,
+        bids_by_generator_by_period : np.ndarray,
+        capacity_by_generator_by_period : np.ndarray,
         capacity_offered : np.ndarray
     ):
         self.actual_domestic_prices = actual_domestic_prices
@@ -16,82 +17,112 @@ class AuctionInformation:
         self.bids_by_generator_by_period = bids_by_generator_by_period
         self.capacity_by_generator_by_period = capacity_by_generator_by_period
         self.capacity_offered = capacity_offered
-        
+        self.auction_results = None
+    
     def run_auction(
         self
     ) -> tuple[dict[str, np.ndarray], np.ndarray]:
-        periods = self.bids_by_generator_by_period[ct.ColumnNames.DELIVERY_PERIOD.value].unique().sort()
-        num_periods = len(periods)
-        
-        bids_by_period = {}
-        capacities_by_period = {}
-        
-        for period in periods:
-            bids_by_period[period] = self.bids_by_generator_by_period.filter(
-                pl.col(ct.ColumnNames.DELIVERY_PERIOD.value) == period
-            ).drop(ct.ColumnNames.DELIVERY_PERIOD.value)
-            
-            capacities_by_period[period] = self.capacity_by_generator_by_period.filter(
-                pl.col(ct.ColumnNames.DELIVERY_PERIOD.value) == period
-            ).drop(ct.ColumnNames.DELIVERY_PERIOD.value)
+        num_periods, num_generators = self.bids_by_generator_by_period.shape
         
-        generator_ids = bids_by_period[periods[0]].columns
-        results_by_generator = {str(generator_id): np.zeros(num_periods) for generator_id in generator_ids}
+        accepted_capacities = np.zeros((num_periods, num_generators))
         clearing_prices = np.zeros(num_periods)
         
-        for period_idx, period in enumerate(periods):
-            accepted_bids, clearing_price = self.run_auction_one_period(
-                bids_by_period[period],
+        for period_idx in range(num_periods):
+            accepted_capacities[period_idx], clearing_prices[period_idx] = self.run_auction_one_period(
+                self.bids_by_generator_by_period[period_idx],
                 self.capacity_offered[period_idx],
-                capacities_by_period[period]
+                self.capacity_by_generator_by_period[period_idx]
             )
-            clearing_prices[period_idx] = clearing_price
-            
-            for generator_id, accepted_capacity in accepted_bids.items():
-                results_by_generator[generator_id][period_idx] = accepted_capacity
+        
+        results_by_generator = get_results_by_generator(accepted_capacities)
+        
+        return results_by_generator, clearing_prices
+    
+    def get_auction_results(
+        self
+    ) -> tuple[dict[str, np.ndarray], np.ndarray]:
+        #The auction outcome is fixed once the bids are drawn, so clear it once and share it between generators
+        if self.auction_results is None:
+            self.auction_results = self.run_auction_batch()
+        
+        return self.auction_results
+    
+    def run_auction_batch(
+        self
+    ) -> tuple[dict[str, np.ndarray], np.ndarray]:
+        accepted_capacities, clearing_prices = clear_auctions(
+            self.bids_by_generator_by_period,
+            self.capacity_by_generator_by_period,
+            self.capacity_offered
+        )
+        results_by_generator = get_results_by_generator(accepted_capacities)
         
         return results_by_generator, clearing_prices
     
     def run_auction_one_period(
         self,
-        bids_by_generator : pl.DataFrame,
+        bid_prices : np.ndarray,
         capacity_offered : float,
-        capacity_by_generator : pl.DataFrame
-    ) -> tuple[dict[str, float], float]:
-        if capacity_offered == 0:
-            return {i : 0 for i in range(len(bids_by_generator))}, 0
-        
-        bid_prices = np.array([bids_by_generator[generator_id][0] for generator_id in bids_by_generator.columns])
-        bid_capacities = np.array([capacity_by_generator[generator_id][0] for generator_id in capacity_by_generator.columns])
-        bid_ids = [generator_id for generator_id in bids_by_generator.columns]
-        
-        if (bid_capacities == 0).all() or (bid_prices == 0).all():
-            return {bid_id: 0 for bid_id in bid_ids}, 0
-        
-        sort_indices = np.argsort(-bid_prices)
+        bid_capacities : np.ndarray
+    ) -> tuple[np.ndarray, float]:
+        bid_prices = np.ascontiguousarray(bid_prices, dtype=np.float64)
         
-        accepted_bids = {bid_id: 0 for bid_id in bid_ids}
-        accepted_capacity = 0
-        clearing_price = 0
-        
-        for idx in sort_indices:
-            bid_id = bid_ids[idx]
-            bid_price = bid_prices[idx]
-            bid_capacity = bid_capacities[idx]
-            
-            remaining_capacity = capacity_offered - accepted_capacity
-            if remaining_capacity <= 0:
-                break
-                
-            if bid_capacity <= remaining_capacity:
-                accepted_bids[bid_id] = bid_capacity
-                accepted_capacity += bid_capacity
-            else:
-                accepted_bids[bid_id] = remaining_capacity
-                accepted_capacity += remaining_capacity
-                clearing_price = bid_price
-                break
+        return clearing_kernel.clear_auction_one_period(
+            bid_prices,
+            float(capacity_offered),
+            np.ascontiguousarray(bid_capacities, dtype=np.float64),
+            np.argsort(-bid_prices)
+        )
+
+def get_results_by_generator(accepted_capacities : np.ndarray) -> dict[str, np.ndarray]:
+    return {str(generator_idx): accepted_capacities[:, generator_idx] for generator_idx in range(accepted_capacities.shape[1])}
+
+def clear_auctions(
+    bid_prices : np.ndarray,
+    bid_capacities : np.ndarray,
+    capacity_offered : np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    #Clears every auction at once. Generators lie along the last axis, so bid_prices and bid_capacities
+    #can be (periods x generators) or carry extra leading axes, e.g. (simulations x periods x generators)
+    bid_prices = np.asarray(bid_prices, dtype=np.float64)
+    bid_capacities = np.broadcast_to(np.asarray(bid_capacities, dtype=np.float64), bid_prices.shape)
+    capacity_offered = np.broadcast_to(np.asarray(capacity_offered, dtype=np.float64), bid_prices.shape[:-1])
+    #NumPy's default sort, as in the original per-period clearing, so tied bids are accepted in the same order
+    sort_indices = np.argsort(-bid_prices, axis=-1)
+    
+    if clearing_kernel.is_compiled:
+        number_of_generators = bid_prices.shape[-1]
+        accepted_capacities, clearing_prices = clearing_kernel.clear_auctions_by_row(
+            np.ascontiguousarray(bid_prices.reshape(-1, number_of_generators)),
+            np.ascontiguousarray(bid_capacities.reshape(-1, number_of_generators)),
+            np.ascontiguousarray(capacity_offered.reshape(-1)),
+            np.ascontiguousarray(sort_indices.reshape(-1, number_of_generators))
+        )
         
-        return accepted_bids, clearing_price
+        return accepted_capacities.reshape(bid_prices.shape), clearing_prices.reshape(bid_prices.shape[:-1])
+    
+    sorted_prices = np.take_along_axis(bid_prices, sort_indices, axis=-1)
+    sorted_capacities = np.take_along_axis(bid_capacities, sort_indices, axis=-1)
+    
+    capacity_before_bid = np.zeros_like(sorted_capacities)
+    capacity_before_bid[..., 1:] = np.cumsum(sorted_capacities[..., :-1], axis=-1)
+    remaining_capacity = capacity_offered[..., np.newaxis] - capacity_before_bid
+    sorted_accepted = np.clip(remaining_capacity, 0, sorted_capacities)
+    
+    #The clearing price is set by the first bid that is only partially accepted
+    is_marginal_bid = (remaining_capacity > 0) & (sorted_capacities > remaining_capacity)
+    marginal_index = is_marginal_bid.argmax(axis=-1)
+    clearing_prices = np.where(
+        is_marginal_bid.any(axis=-1),
+        np.take_along_axis(sorted_prices, marginal_index[..., np.newaxis], axis=-1)[..., 0],
+        0
+    )
+    
+    no_auction = (capacity_offered == 0) | (bid_capacities == 0).all(axis=-1) | (bid_prices == 0).all(axis=-1)
+    sorted_accepted[no_auction] = 0
+    clearing_prices[no_auction] = 0
+    
+    accepted_capacities = np.empty_like(sorted_accepted)
+    np.put_along_axis(accepted_capacities, sort_indices, sorted_accepted, axis=-1)
     
-    
\ No newline at end of file
+    return accepted_capacities, clearing_prices
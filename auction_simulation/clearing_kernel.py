@@ -0,0 +1,72 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+#Auction clearing on raw float arrays. When Numba is installed the kernels below are compiled on first use,
+#otherwise they run as plain Python and callers should prefer the vectorised NumPy clearing in auction_information.
+#Bids are accepted in the order given by sort_indices, which callers take from NumPy's default argsort of the
+#negated bid prices, so that tied bids are accepted in the same order as the original per-period clearing
+
+def clear_auction_one_period(
+    bid_prices : np.ndarray,
+    capacity_offered : float,
+    bid_capacities : np.ndarray,
+    sort_indices : np.ndarray
+) -> tuple[np.ndarray, float]:
+    accepted_bids = np.zeros(len(bid_prices))
+    if capacity_offered == 0:
+        return accepted_bids, 0.0
+    
+    if np.all(bid_capacities == 0) or np.all(bid_prices == 0):
+        return accepted_bids, 0.0
+    
+    accepted_capacity = 0.0
+    clearing_price = 0.0
+    
+    for idx in sort_indices:
+        bid_price = bid_prices[idx]
+        bid_capacity = bid_capacities[idx]
+        
+        remaining_capacity = capacity_offered - accepted_capacity
+        if remaining_capacity <= 0:
+            break
+        
+        if bid_capacity <= remaining_capacity:
+            accepted_bids[idx] = bid_capacity
+            accepted_capacity += bid_capacity
+        else:
+            accepted_bids[idx] = remaining_capacity
+            accepted_capacity += remaining_capacity
+            clearing_price = bid_price
+            break
+    
+    return accepted_bids, clearing_price
+
+def clear_auctions_by_row(
+    bid_prices : np.ndarray,
+    bid_capacities : np.ndarray,
+    capacity_offered : np.ndarray,
+    sort_indices : np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    #One auction per row of the (auctions x generators) arrays
+    number_of_auctions, number_of_generators = bid_prices.shape
+    accepted_capacities = np.zeros((number_of_auctions, number_of_generators))
+    clearing_prices = np.zeros(number_of_auctions)
+    for auction_idx in range(number_of_auctions):
+        accepted_capacities[auction_idx], clearing_prices[auction_idx] = clear_auction_one_period(
+            bid_prices[auction_idx],
+            capacity_offered[auction_idx],
+            bid_capacities[auction_idx],
+            sort_indices[auction_idx]
+        )
+    
+    return accepted_capacities, clearing_prices
+
+is_compiled = numba is not None and not numba.config.DISABLE_JIT
+if is_compiled:
+    #clear_auctions_by_row picks up the compiled one-period kernel when it is itself compiled on first call
+    clear_auction_one_period = numba.njit(cache=True)(clear_auction_one_period)
+    clear_auctions_by_row = numba.njit(cache=True)(clear_auctions_by_row)
@@ -3,27 +3,33 @@ import polars as pl
 import numpy as np
 import constants as ct
 import auction_simulation.auction_information as auction_information
+import auction_simulation.strategy_profile as sp
+import auction_simulation.generator_portfolio as generator_portfolio
+import auction_simulation.forecast_error_sampler as fes
+import auction_simulation.random_streams as random_streams
+
+from collections import OrderedDict
 
 def simulate_day(
     forecast_prices_with_errors_one_day : pl.DataFrame,
-    covariance_matrix : np.ndarray,
+    forecast_error_sampler : fes.ForecastErrorSampler,
     number_of_generators : int,
-    alpha_by_generator : dict[str, float],
-    beta_by_generator : dict[str, float],
-    bid_capacity_by_generator : pl.DataFrame,
-    generator_marginal_cost : float,
-    generator_capacity : int,
-    generator_id : str
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    generator_capacity : int | np.ndarray,
+    generator_id : str,
+    forecast_errors : np.ndarray = None,
+    rng : np.random.Generator = None
 ) -> float:
     
     auction_information_one_day = get_auction_information_one_sim(
         forecast_prices_with_errors_one_day,
-        covariance_matrix,
+        forecast_error_sampler,
         number_of_generators,
-        alpha_by_generator,
-        beta_by_generator,
-        bid_capacity_by_generator,
-        generator_marginal_cost
+        strategy_profile,
+        generator_marginal_cost,
+        forecast_errors,
+        rng
     )
     daily_generator_return = calculate_daily_return_for_generator_one_sim(
         generator_id,
@@ -34,95 +40,174 @@ def simulate_day(
     
     return daily_generator_return
 
-def get_auction_information_one_sim(
+def simulate_auctions_batch(
     forecast_prices_with_errors_one_day : pl.DataFrame,
-    covariance_matrix : np.ndarray,
+    forecast_error_sampler : fes.ForecastErrorSampler,
+    number_of_simulations : int,
     number_of_generators : int,
-    alpha_by_generator : dict[str, float],
-    beta_by_generator : dict[str, float],
-    bid_capacity_by_generator : pl.DataFrame,
-    generator_marginal_cost : float
-) -> auction_information.AuctionInformation:
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    forecast_errors : np.ndarray = None,
+    rng : np.random.Generator = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    forecast_one_day = forecast_prices_with_errors_one_day.sort(ct.ColumnNames.DELIVERY_PERIOD.value)
+    domestic_prices, foreign_prices = get_simulated_prices_batch(
+        forecast_one_day,
+        forecast_error_sampler,
+        number_of_simulations,
+        number_of_generators,
+        forecast_errors,
+        rng
+    )
     
-    periods = sorted(forecast_prices_with_errors_one_day[ct.ColumnNames.DELIVERY_PERIOD.value].unique().to_list())
-    actual_domestic_price = []
-    actual_foreign_price = []
-    bids_by_generator_by_period = {}
-    for period in periods:
-        period_data = forecast_prices_with_errors_one_day.filter(
-            pl.col(ct.ColumnNames.DELIVERY_PERIOD.value) == period
-        )
-        domestic_forecast = period_data[ct.ColumnNames.FORECAST_DOMESTIC_PRICE.value][0]
-        foreign_forecast = period_data[ct.ColumnNames.FORECAST_FOREIGN_PRICE.value][0]
-        
-        samples = np.random.multivariate_normal(
-            [0, 0], covariance_matrix, size=number_of_generators + 1
-        )
-        
-        domestic_prices = domestic_forecast + samples[:, 0]
-        foreign_prices = foreign_forecast + samples[:, 1]
-        actual_domestic_price.append(domestic_prices[0])
-        actual_foreign_price.append(foreign_prices[0])
-        
-        bids_by_generator = get_bids_by_generator(
-            domestic_prices[1:],
-            foreign_prices[1:],
-            alpha_by_generator,
-            beta_by_generator,
-            generator_marginal_cost
+    bid_prices = get_bid_prices(
+        domestic_prices[..., 1:],
+        foreign_prices[..., 1:],
+        strategy_profile.alphas,
+        strategy_profile.betas,
+        generator_marginal_cost
+    )
+    accepted_capacities, clearing_prices = auction_information.clear_auctions(
+        bid_prices,
+        strategy_profile.capacity_bids,
+        forecast_one_day[ct.ColumnNames.AVAILABLE_CAPACITY.value].to_numpy()
+    )
+    
+    return accepted_capacities, clearing_prices, domestic_prices[..., 0], foreign_prices[..., 0]
+
+def simulate_candidate_auctions_batch(
+    forecast_prices_with_errors_one_day : pl.DataFrame,
+    forecast_error_sampler : fes.ForecastErrorSampler,
+    number_of_simulations : int,
+    number_of_generators : int,
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    generator_id : str,
+    candidate_alphas : np.ndarray,
+    candidate_betas : np.ndarray,
+    forecast_errors : np.ndarray = None,
+    rng : np.random.Generator = None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    #Clears the day's auctions for a population of candidate (alpha, beta) strategies for one generator,
+    #with every other generator's strategy fixed. All candidates face the same simulated prices and the
+    #outputs carry a leading candidate axis
+    forecast_one_day = forecast_prices_with_errors_one_day.sort(ct.ColumnNames.DELIVERY_PERIOD.value)
+    generator_idx = int(generator_id)
+    domestic_prices, foreign_prices = get_simulated_prices_batch(
+        forecast_one_day,
+        forecast_error_sampler,
+        number_of_simulations,
+        number_of_generators,
+        forecast_errors,
+        rng
+    )
+    
+    bid_prices = get_bid_prices(
+        domestic_prices[..., 1:],
+        foreign_prices[..., 1:],
+        strategy_profile.alphas,
+        strategy_profile.betas,
+        generator_marginal_cost
+    )
+    candidate_bid_prices = np.repeat(bid_prices[np.newaxis], len(candidate_alphas), axis=0)
+    candidate_bid_prices[..., generator_idx] = get_bid_prices(
+        domestic_prices[np.newaxis, ..., generator_idx + 1],
+        foreign_prices[np.newaxis, ..., generator_idx + 1],
+        np.asarray(candidate_alphas, dtype=np.float64)[:, np.newaxis, np.newaxis],
+        np.asarray(candidate_betas, dtype=np.float64)[:, np.newaxis, np.newaxis],
+        generator_portfolio.get_generator_value(generator_marginal_cost, generator_idx)
+    )
+    accepted_capacities, clearing_prices = auction_information.clear_auctions(
+        candidate_bid_prices,
+        strategy_profile.capacity_bids,
+        forecast_one_day[ct.ColumnNames.AVAILABLE_CAPACITY.value].to_numpy()
+    )
+    
+    return accepted_capacities, clearing_prices, domestic_prices[..., 0], foreign_prices[..., 0]
+
+def get_simulated_prices_batch(
+    forecast_one_day : pl.DataFrame,
+    forecast_error_sampler : fes.ForecastErrorSampler,
+    number_of_simulations : int,
+    number_of_generators : int,
+    forecast_errors : np.ndarray = None,
+    rng : np.random.Generator = None
+) -> tuple[np.ndarray, np.ndarray]:
+    #One draw for every simulation, period and generator; index 0 on the generator axis is the realised price
+    if forecast_errors is None:
+        forecast_errors = forecast_error_sampler.draw(
+            (number_of_simulations, len(forecast_one_day), number_of_generators + 1),
+            rng
         )
-        
-        bids_by_generator_by_period[period] = bids_by_generator
+    domestic_prices = forecast_one_day[ct.ColumnNames.FORECAST_DOMESTIC_PRICE.value].to_numpy()[:, np.newaxis] + forecast_errors[..., 0]
+    foreign_prices = forecast_one_day[ct.ColumnNames.FORECAST_FOREIGN_PRICE.value].to_numpy()[:, np.newaxis] + forecast_errors[..., 1]
     
-    rows = []
-    for period, bids_dict in bids_by_generator_by_period.items():
-        row = {ct.ColumnNames.DELIVERY_PERIOD.value: period}
-        row.update(bids_dict)
-        rows.append(row)
+    return domestic_prices, foreign_prices
+
+def get_auction_information_one_sim(
+    forecast_prices_with_errors_one_day : pl.DataFrame,
+    forecast_error_sampler : fes.ForecastErrorSampler,
+    number_of_generators : int,
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    forecast_errors : np.ndarray = None,
+    rng : np.random.Generator = None
+) -> auction_information.AuctionInformation:
     
-    bids_df = pl.DataFrame(rows)
-    bids_df = bids_df.sort(
-        pl.col(ct.ColumnNames.DELIVERY_PERIOD.value)
+    #Every period and generator at once, drawing the same random numbers in the same order as one draw per period
+    forecast_one_day = forecast_prices_with_errors_one_day.sort(ct.ColumnNames.DELIVERY_PERIOD.value)
+    domestic_prices, foreign_prices = get_simulated_prices_batch(
+        forecast_one_day,
+        forecast_error_sampler,
+        1,
+        number_of_generators,
+        None if forecast_errors is None else forecast_errors[np.newaxis],
+        rng
+    )
+    
+    bid_prices = get_bid_prices(
+        domestic_prices[0, :, 1:],
+        foreign_prices[0, :, 1:],
+        strategy_profile.alphas,
+        strategy_profile.betas,
+        generator_marginal_cost
     )
     
     auction_information_one_day = auction_information.AuctionInformation(
-        actual_domestic_prices = np.array(actual_domestic_price),
-        actual_foreign_prices = np.array(actual_foreign_price),
-        bids_by_generator_by_period = bids_df,
-        capacity_by_generator_by_period = bid_capacity_by_generator,
-        capacity_offered = forecast_prices_with_errors_one_day[ct.ColumnNames.AVAILABLE_CAPACITY.value].to_numpy()
+        actual_domestic_prices = domestic_prices[0, :, 0],
+        actual_foreign_prices = foreign_prices[0, :, 0],
+        bids_by_generator_by_period = bid_prices,
+        capacity_by_generator_by_period = strategy_profile.capacity_bids,
+        capacity_offered = forecast_one_day[ct.ColumnNames.AVAILABLE_CAPACITY.value].to_numpy()
     )
     
     return auction_information_one_day
-        
-def get_bids_by_generator(
+
+def get_bid_prices(
     export_market_prices: np.ndarray,
     domestic_market_prices: np.ndarray,
-    alpha_by_generator: dict[int, float],
-    beta_by_generator: dict[int, float],
-    generator_marginal_cost: float
-):
+    alphas: np.ndarray,
+    betas: np.ndarray,
+    generator_marginal_cost: float | np.ndarray
+) -> np.ndarray:
+    #Generators along the last axis, which a per-generator marginal cost broadcasts along
     option_values = np.maximum(export_market_prices - domestic_market_prices, 0)
     option_values[export_market_prices <= generator_marginal_cost] = 0
     #Bid prices must be non-negative
-    bid_prices = {}
-    for generator_id in alpha_by_generator:
-        idx = int(generator_id)
-        bid_prices[str(generator_id)] = max(
-            alpha_by_generator[generator_id] + beta_by_generator[generator_id] * option_values[idx], 
-            0
-        )
-   
+    bid_prices = np.maximum(alphas + betas * option_values, 0)
+    
     return bid_prices
 
 def calculate_daily_return_for_generator_one_sim(
     generator_id : str,
     auction_information_one_sim : auction_information.AuctionInformation,
-    generator_capacity : int,
-    generator_marginal_cost : float,
+    generator_capacity : int | np.ndarray,
+    generator_marginal_cost : float | np.ndarray,
 ) -> float:
     
-    auction_results, clearing_prices = auction_information_one_sim.run_auction()
+    generator_capacity = generator_portfolio.get_generator_value(generator_capacity, int(generator_id))
+    generator_marginal_cost = generator_portfolio.get_generator_value(generator_marginal_cost, int(generator_id))
+    auction_results, clearing_prices = auction_information_one_sim.get_auction_results()
     auction_results_for_generator = auction_results[generator_id]
     capacity_for_domestic_market = generator_capacity - auction_results_for_generator
     
@@ -149,6 +234,40 @@ def calculate_daily_return_for_generator_one_sim(
     
     return daily_return
 
+def calculate_daily_returns_batch(
+    accepted_capacities : np.ndarray,
+    clearing_prices : np.ndarray,
+    actual_domestic_prices : np.ndarray,
+    actual_foreign_prices : np.ndarray,
+    generator_capacity : int | np.ndarray,
+    generator_marginal_cost : float | np.ndarray
+) -> np.ndarray:
+    #Array version of calculate_daily_return_for_generator_one_sim. Takes (simulations x periods x generators)
+    #accepted capacities and returns a (simulations x generators) array of daily returns. Capacity and marginal
+    #cost are scalars or per-generator arrays along the last axis
+    capacity_for_domestic_market = generator_capacity - accepted_capacities
+    
+    domestic_prices = actual_domestic_prices[..., np.newaxis]
+    foreign_prices = actual_foreign_prices[..., np.newaxis]
+    domestic_prices = np.where(domestic_prices < generator_marginal_cost, 0, domestic_prices)
+    foreign_prices = np.where(foreign_prices < generator_marginal_cost, 0, foreign_prices)
+    
+    domestic_generation_costs = np.where(domestic_prices > 0, generator_marginal_cost, 0)
+    foreign_generation_costs = np.where(foreign_prices > 0, generator_marginal_cost, 0)
+    foreign_capacity_costs = np.where(accepted_capacities > 0, clearing_prices[..., np.newaxis], 0)
+    total_foreign_costs = foreign_generation_costs + foreign_capacity_costs
+    
+    revenue_by_period = capacity_for_domestic_market * domestic_prices + accepted_capacities * foreign_prices
+    costs_by_period = capacity_for_domestic_market * domestic_generation_costs + accepted_capacities * total_foreign_costs
+    
+    daily_revenue = revenue_by_period.sum(axis=-2)
+    daily_costs = costs_by_period.sum(axis=-2)
+    
+    daily_returns = np.zeros_like(daily_costs)
+    np.divide(daily_revenue - daily_costs, daily_costs, out=daily_returns, where=daily_costs != 0)
+    
+    return daily_returns
+
 @functools.lru_cache(maxsize=128)
 def get_covariance_matrix(
     forecast_error_correlation: float,
@@ -160,14 +279,168 @@ def get_covariance_matrix(
         [forecast_error_correlation, 1.0]
     ])
     std_vector = np.array([domestic_stdev, foreign_stdev])
-    return np.outer(std_vector, std_vector) * corr_matrix
+    covariance_matrix = np.outer(std_vector, std_vector) * corr_matrix
+    #Cached, so callers must not be able to change it in place
+    covariance_matrix.setflags(write=False)
+    
+    return covariance_matrix
+
+@functools.lru_cache(maxsize=128)
+def get_covariance_matrix_by_period(
+    forecast_error_correlation_by_period: tuple[float, ...],
+    domestic_stdev_by_period: tuple[float, ...],
+    foreign_stdev_by_period: tuple[float, ...]
+) -> np.ndarray:
+    #Stacked (periods x 2 x 2) version of get_covariance_matrix
+    forecast_error_correlation = np.asarray(forecast_error_correlation_by_period, dtype=np.float64)
+    domestic_stdev = np.asarray(domestic_stdev_by_period, dtype=np.float64)
+    foreign_stdev = np.asarray(foreign_stdev_by_period, dtype=np.float64)
+    
+    covariance_matrix_by_period = np.empty((len(forecast_error_correlation), 2, 2))
+    covariance_matrix_by_period[:, 0, 0] = domestic_stdev * domestic_stdev
+    covariance_matrix_by_period[:, 1, 1] = foreign_stdev * foreign_stdev
+    covariance_matrix_by_period[:, 0, 1] = domestic_stdev * foreign_stdev * forecast_error_correlation
+    covariance_matrix_by_period[:, 1, 0] = covariance_matrix_by_period[:, 0, 1]
+    covariance_matrix_by_period.setflags(write=False)
+    
+    return covariance_matrix_by_period
+
+@functools.lru_cache(maxsize=128)
+def get_forecast_error_sampler(
+    forecast_error_correlation: float | tuple[float, ...],
+    domestic_stdev: float | tuple[float, ...],
+    foreign_stdev: float | tuple[float, ...]
+) -> fes.ForecastErrorSampler:
+    #Tuples of per-period values give a sampler with one covariance per period
+    if isinstance(forecast_error_correlation, tuple):
+        covariance_matrix = get_covariance_matrix_by_period(forecast_error_correlation, domestic_stdev, foreign_stdev)
+    else:
+        covariance_matrix = get_covariance_matrix(forecast_error_correlation, domestic_stdev, foreign_stdev)
+    
+    return fes.ForecastErrorSampler(covariance_matrix)
+
+#Common random numbers: the day's (simulations x periods x generators + 1 x 2) forecast errors for a random stream,
+#reused for every strategy evaluated against it. They are drawn in fixed-size blocks, each from its own numbered
+#child of the stream, so any run of simulations can be drawn on its own and only the blocks in use are held.
+#Block sizes grow with periods x generators, so the held blocks are bounded by their total bytes rather than by count
+common_forecast_error_block_size = 100
+maximum_common_forecast_error_bytes = 2 ** 28
+common_forecast_error_blocks = OrderedDict()
+
+def get_common_forecast_error_block(
+    date,
+    block_idx: int,
+    number_of_periods: int,
+    number_of_generators: int,
+    forecast_error_correlation: float | tuple[float, ...],
+    domestic_stdev: float | tuple[float, ...],
+    foreign_stdev: float | tuple[float, ...],
+    stream_id: tuple = None
+) -> np.ndarray:
+    key = (date, block_idx, number_of_periods, number_of_generators, forecast_error_correlation, domestic_stdev, foreign_stdev, stream_id)
+    if key in common_forecast_error_blocks:
+        common_forecast_error_blocks.move_to_end(key)
+        return common_forecast_error_blocks[key]
+    
+    forecast_error_sampler = get_forecast_error_sampler(forecast_error_correlation, domestic_stdev, foreign_stdev)
+    forecast_errors = forecast_error_sampler.draw(
+        (common_forecast_error_block_size, number_of_periods, number_of_generators + 1),
+        random_streams.get_rng_from_stream_id(stream_id, block_idx)
+    )
+    forecast_errors.setflags(write=False)
+    
+    #The least recently used blocks are dropped until the new one fits, though the new block is always kept
+    held_bytes = sum(block.nbytes for block in common_forecast_error_blocks.values())
+    while common_forecast_error_blocks and held_bytes + forecast_errors.nbytes > maximum_common_forecast_error_bytes:
+        _, evicted_block = common_forecast_error_blocks.popitem(last=False)
+        held_bytes -= evicted_block.nbytes
+    common_forecast_error_blocks[key] = forecast_errors
+    
+    return forecast_errors
+
+def clear_common_forecast_error_blocks() -> None:
+    common_forecast_error_blocks.clear()
+
+def get_common_forecast_errors(
+    date,
+    first_simulation: int,
+    number_of_simulations: int,
+    number_of_periods: int,
+    number_of_generators: int,
+    forecast_error_correlation: float | tuple[float, ...],
+    domestic_stdev: float | tuple[float, ...],
+    foreign_stdev: float | tuple[float, ...],
+    stream_id: tuple = None
+) -> np.ndarray:
+    #Simulations first_simulation onwards, assembled from the blocks they fall in
+    first_block_idx = first_simulation // common_forecast_error_block_size
+    last_block_idx = (first_simulation + number_of_simulations - 1) // common_forecast_error_block_size
+    forecast_error_blocks = [
+        get_common_forecast_error_block(
+            date,
+            block_idx,
+            number_of_periods,
+            number_of_generators,
+            forecast_error_correlation,
+            domestic_stdev,
+            foreign_stdev,
+            stream_id
+        )
+        for block_idx in range(first_block_idx, last_block_idx + 1)
+    ]
+    forecast_errors = forecast_error_blocks[0] if len(forecast_error_blocks) == 1 else np.concatenate(forecast_error_blocks)
+    forecast_errors.setflags(write=False)
+    first_simulation_in_block = first_simulation - first_block_idx * common_forecast_error_block_size
+    
+    return forecast_errors[first_simulation_in_block:first_simulation_in_block + number_of_simulations]
+
+def get_common_forecast_errors_from_df(
+    forecast_prices_with_errors_one_day: pl.DataFrame,
+    number_of_simulations: int,
+    number_of_generators: int,
+    seed_sequence: np.random.SeedSequence = None,
+    first_simulation: int = 0
+) -> np.ndarray:
+    forecast_errors = get_common_forecast_errors(
+        forecast_prices_with_errors_one_day[ct.ColumnNames.DATE.value][0],
+        first_simulation,
+        number_of_simulations,
+        forecast_prices_with_errors_one_day[ct.ColumnNames.DELIVERY_PERIOD.value].n_unique(),
+        number_of_generators,
+        *get_forecast_error_parameters(forecast_prices_with_errors_one_day),
+        random_streams.get_stream_id(seed_sequence)
+    )
+    
+    return forecast_errors
 
-# Then update the original function:
 def get_covariance_matrix_from_df(forecast_prices_with_errors_one_day: pl.DataFrame) -> np.ndarray:
-    forecast_error_correlation = forecast_prices_with_errors_one_day[ct.ColumnNames.FORECAST_ERROR_CORRELATIONS.value][0]
-    domestic_stdev = forecast_prices_with_errors_one_day[ct.ColumnNames.DOMESTIC_FORECAST_ERROR_STDEV.value][0]
-    foreign_stdev = forecast_prices_with_errors_one_day[ct.ColumnNames.FOREIGN_FORECAST_ERROR_STDEV.value][0]
+    #A (2 x 2) matrix when the error statistics are the same all day, otherwise (periods x 2 x 2)
+    forecast_error_correlation, domestic_stdev, foreign_stdev = get_forecast_error_parameters(forecast_prices_with_errors_one_day)
+    if isinstance(forecast_error_correlation, tuple):
+        return get_covariance_matrix_by_period(forecast_error_correlation, domestic_stdev, foreign_stdev)
     
     covariance_matrix = get_covariance_matrix(forecast_error_correlation, domestic_stdev, foreign_stdev)
     
-    return covariance_matrix
\ No newline at end of file
+    return covariance_matrix
+
+def get_forecast_error_sampler_from_df(forecast_prices_with_errors_one_day: pl.DataFrame) -> fes.ForecastErrorSampler:
+    forecast_error_sampler = get_forecast_error_sampler(
+        *get_forecast_error_parameters(forecast_prices_with_errors_one_day)
+    )
+    
+    return forecast_error_sampler
+
+def get_forecast_error_parameters(
+    forecast_prices_with_errors_one_day: pl.DataFrame
+) -> tuple[float | tuple[float, ...], float | tuple[float, ...], float | tuple[float, ...]]:
+    #Scalars when every period shares the same error statistics, otherwise tuples in delivery period order,
+    #so that both can be used as cache keys
+    error_statistics = forecast_prices_with_errors_one_day.sort(ct.ColumnNames.DELIVERY_PERIOD.value).select(
+        ct.ColumnNames.FORECAST_ERROR_CORRELATIONS.value,
+        ct.ColumnNames.DOMESTIC_FORECAST_ERROR_STDEV.value,
+        ct.ColumnNames.FOREIGN_FORECAST_ERROR_STDEV.value
+    )
+    if all(error_statistics[column].n_unique() == 1 for column in error_statistics.columns):
+        return tuple(error_statistics.row(0))
+    
+    return tuple(tuple(error_statistics[column].to_list()) for column in error_statistics.columns)
\ No newline at end of file
@@ -0,0 +1,40 @@
+import numpy as np
+
+class ForecastErrorSampler:
+    #Draws correlated (domestic, foreign) forecast errors as blocks of standard normals multiplied by the
+    #Cholesky factor of the covariance matrix, which is factorised once when the sampler is built.
+    #The covariance is either one (2 x 2) matrix or a stacked (periods x 2 x 2) tensor with one matrix per period
+    def __init__(
+        self,
+        covariance_matrix : np.ndarray
+    ):
+        self.covariance_matrix = covariance_matrix
+        self.cholesky_factor = get_cholesky_factor(covariance_matrix)
+    
+    def draw(
+        self,
+        size : tuple[int, ...],
+        rng : np.random.Generator = None
+    ) -> np.ndarray:
+        #Returns an array of shape size + (2,). With a covariance per period, size[-2] must be the periods axis.
+        #Without a generator the draws come from the global numpy random state
+        random_state = np.random if rng is None else rng
+        if self.cholesky_factor.ndim == 2:
+            standard_normals = random_state.standard_normal((int(np.prod(size)), 2))
+            return (standard_normals @ self.cholesky_factor.T).reshape(tuple(size) + (2,))
+        
+        standard_normals = random_state.standard_normal(tuple(size) + (2,))
+        forecast_errors = np.einsum('pij,...pgj->...pgi', self.cholesky_factor, standard_normals)
+        
+        return forecast_errors
+
+def get_cholesky_factor(covariance_matrix : np.ndarray) -> np.ndarray:
+    try:
+        cholesky_factor = np.linalg.cholesky(covariance_matrix)
+    except np.linalg.LinAlgError:
+        #Singular covariance (a zero stdev or perfectly correlated errors): factorise through the eigendecomposition instead
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance_matrix)
+        cholesky_factor = eigenvectors * np.sqrt(np.maximum(eigenvalues, 0))[..., np.newaxis, :]
+    cholesky_factor.setflags(write=False)
+    
+    return cholesky_factor
@@ -0,0 +1,45 @@
+import numpy as np
+import polars as pl
+import constants as ct
+import auction_simulation.strategy_profile as sp
+
+class GeneratorPortfolio:
+    #The fleet's per-generator parameters held as columns, with generator i at index i and labelled generator_ids[i]
+    #in the strategies the model writes out. The simulation takes the arrays directly in place of the scalar marginal
+    #cost, capacity and risk aversion, broadcasting them along the generator axis, so a heterogeneous fleet costs no
+    #more per generator than an identical one
+    def __init__(
+        self,
+        generator_ids: list[str],
+        marginal_costs: np.ndarray,
+        capacities: np.ndarray,
+        risk_aversions: np.ndarray
+    ):
+        self.generator_ids = [str(generator_id) for generator_id in generator_ids]
+        self.marginal_costs = sp.get_read_only_array(marginal_costs)
+        self.capacities = sp.get_read_only_array(capacities)
+        self.risk_aversions = sp.get_read_only_array(risk_aversions)
+        self.number_of_generators = len(self.generator_ids)
+
+def get_generator_portfolio_from_df(portfolio_df: pl.DataFrame) -> GeneratorPortfolio:
+    generator_portfolio = GeneratorPortfolio(
+        portfolio_df[ct.ColumnNames.GENERATOR_ID.value].cast(pl.Utf8).to_list(),
+        portfolio_df[ct.ColumnNames.MARGINAL_COST.value].to_numpy(),
+        portfolio_df[ct.ColumnNames.CAPACITY.value].to_numpy(),
+        portfolio_df[ct.ColumnNames.RISK_AVERSION.value].to_numpy()
+    )
+    
+    return generator_portfolio
+
+def get_generator_value(
+    values: float | np.ndarray,
+    generator_idx: int
+) -> float | np.ndarray:
+    #A parameter is either one value shared by every generator or an array with one value per generator
+    if np.ndim(values) == 0:
+        return values
+    
+    return values[generator_idx]
+
+def is_uniform(values: float | np.ndarray) -> bool:
+    return np.ndim(values) == 0 or bool((np.asarray(values) == np.asarray(values).flat[0]).all())
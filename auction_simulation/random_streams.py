@@ -0,0 +1,79 @@
+import numpy as np
+
+#Random streams are identified by a numpy SeedSequence handed down the stack. Each independent piece of work
+#(interconnector, day, generator, simulation batch) spawns its own child, so results are reproducible and do not
+#depend on which process does the work or in what order. A missing SeedSequence falls back to the global numpy state
+
+def get_seed_sequence(random_seed: int | np.random.SeedSequence = None) -> np.random.SeedSequence:
+    if isinstance(random_seed, np.random.SeedSequence):
+        return random_seed
+    
+    return np.random.SeedSequence(random_seed)
+
+def spawn_seed_sequences(
+    seed_sequence: np.random.SeedSequence,
+    number_of_children: int
+) -> list[np.random.SeedSequence | None]:
+    if seed_sequence is None:
+        return [None] * number_of_children
+    
+    return seed_sequence.spawn(number_of_children)
+
+def get_batch_rng(seed_sequence: np.random.SeedSequence = None) -> np.random.Generator | None:
+    #A fresh child stream for each batch of simulations drawn from this stream
+    if seed_sequence is None:
+        return None
+    
+    return np.random.default_rng(seed_sequence.spawn(1)[0])
+
+def get_random_state(
+    seed_sequence: np.random.SeedSequence = None,
+    default_random_state: int = 42
+) -> int:
+    #Integer seed for third-party code that does not take a Generator
+    if seed_sequence is None:
+        return default_random_state
+    
+    return int(seed_sequence.spawn(1)[0].generate_state(1)[0])
+
+def get_round_seed_sequence(
+    seed_sequence: np.random.SeedSequence,
+    round_idx: int,
+    children_per_round: int = 2 ** 16
+) -> np.random.SeedSequence | None:
+    #A copy of the stream for one round of work that may run in another process. It keeps the stream's identity,
+    #so common random numbers and cache keys carry over between rounds, but spawns its children from a
+    #round-specific offset, so each round still draws fresh children wherever it runs
+    if seed_sequence is None:
+        return None
+    
+    return np.random.SeedSequence(
+        seed_sequence.entropy,
+        spawn_key=seed_sequence.spawn_key,
+        pool_size=seed_sequence.pool_size,
+        n_children_spawned=round_idx * children_per_round
+    )
+
+def get_stream_id(seed_sequence: np.random.SeedSequence = None) -> tuple | None:
+    #Hashable identity of a stream, for use in cache keys
+    if seed_sequence is None:
+        return None
+    
+    entropy = seed_sequence.entropy
+    
+    return (entropy if isinstance(entropy, int) else tuple(entropy), seed_sequence.spawn_key)
+
+def get_rng_from_stream_id(
+    stream_id: tuple = None,
+    child_idx: int = None
+) -> np.random.Generator | None:
+    #With a child index, the generator for that numbered child of the stream, which can be rebuilt on its own
+    #wherever and whenever it is needed
+    if stream_id is None:
+        return None
+    
+    entropy, spawn_key = stream_id
+    if child_idx is not None:
+        spawn_key = spawn_key + (child_idx,)
+    
+    return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=spawn_key))
@@ -2,54 +2,272 @@ import polars as pl
 import numpy as np
 import constants as ct
 import auction_simulation.day_simulation as day_simulation
+import auction_simulation.strategy_profile as sp
+import auction_simulation.generator_portfolio as generator_portfolio
+import auction_simulation.forecast_error_sampler as fes
+import auction_simulation.utility_accumulator as ua
+import auction_simulation.random_streams as random_streams
+import auction_simulation.utility_cache as uc
+
+#Shared by every evaluation in this process
+shared_utility_cache = uc.UtilityCache()
+#Largest (candidates x simulations x periods x generators) array built when scoring candidate strategies
+maximum_candidate_chunk_elements = 2 ** 22
+#Utility evaluations requested in this process, whether simulated or served from the cache
+evaluation_statistics = {"utility_evaluations": 0}
 
 def run_simulations(
     date: str,
     number_of_simulations: int,
     number_of_generators: int,
     forecast_one_ic: pl.DataFrame,
-    alpha_by_generator: dict[str, float],
-    beta_by_generator: dict[str, float],
-    bid_capacity_by_generator: pl.DataFrame,
-    generator_marginal_cost: float,
-    generator_capacity: float,
+    strategy_profile: sp.StrategyProfile,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
     generator_id: str,
-    risk_aversion: float
+    risk_aversion: float | np.ndarray,
+    batched_simulations: bool = False,
+    common_random_numbers: bool = False,
+    seed_sequence: np.random.SeedSequence = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False
 ):
-    daily_returns_by_sim = run_day_simulations(
+    cache_key = get_utility_cache_key(
+        date,
+        forecast_one_ic,
+        strategy_profile,
+        get_run_simulations_settings(
+            number_of_simulations,
+            number_of_generators,
+            generator_marginal_cost,
+            generator_capacity,
+            generator_id,
+            risk_aversion,
+            batched_simulations,
+            target_standard_error,
+            simulation_batch_size,
+            streaming_simulations
+        ),
+        common_random_numbers,
+        seed_sequence
+    )
+    evaluation_statistics["utility_evaluations"] += 1
+    cached_utility = None if cache_key is None else shared_utility_cache.get(cache_key)
+    if cached_utility is not None:
+        return cached_utility
+    
+    if streaming_simulations or target_standard_error is not None:
+        utility_accumulator = stream_day_simulations(
+            date,
+            number_of_simulations,
+            number_of_generators,
+            forecast_one_ic,
+            strategy_profile,
+            generator_marginal_cost,
+            generator_capacity,
+            generator_id,
+            risk_aversion,
+            batched_simulations,
+            common_random_numbers,
+            seed_sequence,
+            simulation_batch_size,
+            target_standard_error
+        )
+        utility = float(utility_accumulator.get_utility())
+        if cache_key is not None:
+            shared_utility_cache.put(cache_key, utility)
+        
+        return utility
+    
+    day_simulations_function = run_day_simulations_batched if batched_simulations else run_day_simulations
+    daily_returns_by_sim = day_simulations_function(
         date,
         number_of_simulations,
         number_of_generators,
         forecast_one_ic,
-        alpha_by_generator,
-        beta_by_generator,
-        bid_capacity_by_generator,
+        strategy_profile,
         generator_marginal_cost,
         generator_capacity,
-        generator_id
+        generator_id,
+        common_random_numbers,
+        seed_sequence
     )
     
     utility = calculate_utility(
         daily_returns_by_sim,
-        risk_aversion
+        generator_portfolio.get_generator_value(risk_aversion, int(generator_id))
     )
+    if cache_key is not None:
+        shared_utility_cache.put(cache_key, utility)
     
     return utility
 
+def stream_day_simulations(
+    date: str,
+    maximum_number_of_simulations: int,
+    number_of_generators: int,
+    forecast_one_ic: pl.DataFrame,
+    strategy_profile: sp.StrategyProfile,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    generator_id: str | None,
+    risk_aversion: float | np.ndarray,
+    batched_simulations: bool = False,
+    common_random_numbers: bool = False,
+    seed_sequence: np.random.SeedSequence = None,
+    simulation_batch_size: int = 100,
+    target_standard_error: float = None
+) -> ua.UtilityAccumulator:
+    #Streaming counterpart of run_day_simulations: simulates in batches and folds each batch into a running
+    #accumulator, so only one batch of returns is ever held. A generator_id of None accumulates every generator.
+    #With a target standard error the stream stops as soon as the utility estimate is that precise, otherwise it
+    #runs to the cap. With common random numbers each batch draws only its own part of the day's error blocks,
+    #so stopping early also saves the draws
+    forecast_one_day = forecast_one_ic.filter(pl.col(ct.ColumnNames.DATE.value) == date)
+    forecast_error_sampler = day_simulation.get_forecast_error_sampler_from_df(forecast_one_day)
+    rng = None if common_random_numbers else random_streams.get_batch_rng(seed_sequence)
+    if generator_id is None:
+        utility_accumulator = ua.UtilityAccumulator(risk_aversion, (number_of_generators,))
+    else:
+        utility_accumulator = ua.UtilityAccumulator(generator_portfolio.get_generator_value(risk_aversion, int(generator_id)))
+    
+    while utility_accumulator.count < maximum_number_of_simulations:
+        first_simulation = utility_accumulator.count
+        number_of_simulations = min(simulation_batch_size, maximum_number_of_simulations - first_simulation)
+        batch_forecast_errors = get_forecast_errors(
+            forecast_one_day,
+            number_of_simulations,
+            number_of_generators,
+            common_random_numbers,
+            seed_sequence,
+            first_simulation
+        )
+        if batched_simulations or generator_id is None:
+            daily_returns_by_sim = simulate_daily_returns_all_generators(
+                forecast_one_day,
+                forecast_error_sampler,
+                number_of_simulations,
+                number_of_generators,
+                strategy_profile,
+                generator_marginal_cost,
+                generator_capacity,
+                batched_simulations,
+                batch_forecast_errors,
+                rng
+            )
+            if generator_id is not None:
+                daily_returns_by_sim = daily_returns_by_sim[:, int(generator_id)]
+        else:
+            daily_returns_by_sim = simulate_daily_returns(
+                forecast_one_day,
+                forecast_error_sampler,
+                number_of_simulations,
+                number_of_generators,
+                strategy_profile,
+                generator_marginal_cost,
+                generator_capacity,
+                generator_id,
+                batch_forecast_errors,
+                rng
+            )
+        utility_accumulator.add_batch(daily_returns_by_sim)
+        
+        if (
+            target_standard_error is not None
+            and utility_accumulator.count > 1
+            and utility_accumulator.get_standard_error().max() <= target_standard_error
+        ):
+            break
+    
+    return utility_accumulator
+
 def get_utility_by_generator(
     date: str,
     number_of_simulations: int,
     number_of_generators: int,
     forecast_one_ic: pl.DataFrame,
-    alpha_by_generator: dict[str, float],
-    beta_by_generator: dict[str, float],
-    bid_capacity_by_generator: pl.DataFrame,
-    generator_marginal_cost: float,
-    generator_capacity: float,
-    risk_aversion: float
+    strategy_profile: sp.StrategyProfile,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    risk_aversion: float | np.ndarray,
+    batched_simulations: bool = False,
+    shared_simulations: bool = False,
+    common_random_numbers: bool = False,
+    seed_sequence: np.random.SeedSequence = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False
 ) -> dict[str, float]:
+    cache_key = get_utility_cache_key(
+        date,
+        forecast_one_ic,
+        strategy_profile,
+        (
+            "get_utility_by_generator",
+            number_of_simulations,
+            number_of_generators,
+            generator_marginal_cost,
+            generator_capacity,
+            risk_aversion,
+            batched_simulations,
+            shared_simulations,
+            simulation_batch_size if streaming_simulations else None
+        ),
+        common_random_numbers,
+        seed_sequence
+    )
+    cached_utility_by_generator = None if cache_key is None else shared_utility_cache.get(cache_key)
+    if cached_utility_by_generator is not None:
+        evaluation_statistics["utility_evaluations"] += number_of_generators
+        return cached_utility_by_generator.copy()
     
     utility_by_generator = {}
+    #Without shared simulations each generator is counted by run_simulations
+    if shared_simulations:
+        evaluation_statistics["utility_evaluations"] += number_of_generators
+    
+    if shared_simulations and streaming_simulations:
+        utility_accumulator = stream_day_simulations(
+            date,
+            number_of_simulations,
+            number_of_generators,
+            forecast_one_ic,
+            strategy_profile,
+            generator_marginal_cost,
+            generator_capacity,
+            None,
+            risk_aversion,
+            batched_simulations,
+            common_random_numbers,
+            seed_sequence,
+            simulation_batch_size
+        )
+        utility_by_generator = {str(i): utility for i, utility in enumerate(utility_accumulator.get_utility().tolist())}
+        if cache_key is not None:
+            shared_utility_cache.put(cache_key, utility_by_generator.copy())
+        
+        return utility_by_generator
+    
+    if shared_simulations:
+        daily_returns_by_generator = run_day_simulations_all_generators(
+            date,
+            number_of_simulations,
+            number_of_generators,
+            forecast_one_ic,
+            strategy_profile,
+            generator_marginal_cost,
+            generator_capacity,
+            batched_simulations,
+            common_random_numbers,
+            seed_sequence
+        )
+        utility_by_generator = {
+            str(i): utility for i, utility in enumerate(calculate_utility(daily_returns_by_generator, risk_aversion, axis = 0).tolist())
+        }
+        if cache_key is not None:
+            shared_utility_cache.put(cache_key, utility_by_generator.copy())
+        
+        return utility_by_generator
     
     for generator_id in range(number_of_generators):
         utility = run_simulations(
@@ -57,57 +275,398 @@ def get_utility_by_generator(
             number_of_simulations,
             number_of_generators,
             forecast_one_ic,
-            alpha_by_generator,
-            beta_by_generator,
-            bid_capacity_by_generator,
+            strategy_profile,
             generator_marginal_cost,
             generator_capacity,
             str(generator_id),
-            risk_aversion
+            risk_aversion,
+            batched_simulations,
+            common_random_numbers,
+            seed_sequence,
+            None,
+            simulation_batch_size,
+            streaming_simulations
         )
         utility_by_generator[str(generator_id)] = utility
+    if cache_key is not None:
+        shared_utility_cache.put(cache_key, utility_by_generator.copy())
     
     return utility_by_generator
 
+def run_simulations_for_candidates(
+    date: str,
+    number_of_simulations: int,
+    number_of_generators: int,
+    forecast_one_ic: pl.DataFrame,
+    strategy_profile: sp.StrategyProfile,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    generator_id: str,
+    risk_aversion: float | np.ndarray,
+    candidate_alphas: np.ndarray,
+    candidate_betas: np.ndarray,
+    batched_simulations: bool = False,
+    common_random_numbers: bool = False,
+    seed_sequence: np.random.SeedSequence = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False
+) -> np.ndarray:
+    #Scores a population of candidate strategies for one generator with vectorised simulations, a chunk of
+    #candidates at a time so the (candidates x simulations x periods x generators) arrays stay bounded
+    evaluation_statistics["utility_evaluations"] += len(candidate_alphas)
+    forecast_one_day = forecast_one_ic.filter(pl.col(ct.ColumnNames.DATE.value) == date)
+    forecast_error_sampler = day_simulation.get_forecast_error_sampler_from_df(forecast_one_day)
+    forecast_errors = get_forecast_errors(
+        forecast_one_day,
+        number_of_simulations,
+        number_of_generators,
+        common_random_numbers,
+        seed_sequence
+    )
+    if forecast_errors is None:
+        #Drawn up front, so that every chunk of candidates faces the same draws
+        forecast_errors = forecast_error_sampler.draw(
+            (number_of_simulations, len(forecast_one_day), number_of_generators + 1),
+            random_streams.get_batch_rng(seed_sequence)
+        )
+    generator_idx = int(generator_id)
+    candidate_alphas = np.asarray(candidate_alphas, dtype=np.float64)
+    candidate_betas = np.asarray(candidate_betas, dtype=np.float64)
+    candidate_chunk_size = max(
+        1,
+        maximum_candidate_chunk_elements // (number_of_simulations * len(forecast_one_day) * number_of_generators)
+    )
+    
+    utility_by_candidate = np.zeros(len(candidate_alphas))
+    for chunk_start in range(0, len(candidate_alphas), candidate_chunk_size):
+        chunk = slice(chunk_start, chunk_start + candidate_chunk_size)
+        accepted_capacities, clearing_prices, actual_domestic_prices, actual_foreign_prices = day_simulation.simulate_candidate_auctions_batch(
+            forecast_one_day,
+            forecast_error_sampler,
+            number_of_simulations,
+            number_of_generators,
+            strategy_profile,
+            generator_marginal_cost,
+            generator_id,
+            candidate_alphas[chunk],
+            candidate_betas[chunk],
+            forecast_errors
+        )
+        daily_returns_by_candidate = day_simulation.calculate_daily_returns_batch(
+            accepted_capacities[..., generator_idx:generator_idx + 1],
+            clearing_prices,
+            actual_domestic_prices,
+            actual_foreign_prices,
+            generator_portfolio.get_generator_value(generator_capacity, generator_idx),
+            generator_portfolio.get_generator_value(generator_marginal_cost, generator_idx)
+        )[..., 0]
+        utility_by_candidate[chunk] = calculate_utility(
+            daily_returns_by_candidate,
+            generator_portfolio.get_generator_value(risk_aversion, generator_idx),
+            axis = -1
+        )
+    
+    #On the same common random numbers the candidate simulation matches a fixed-size run_simulations call (up to
+    #rounding in the sums), so each candidate's utility is cached under the caller's settings for the re-evaluation
+    #of the chosen strategy. Adaptive and streamed runs draw their simulations differently, so are not written
+    if streaming_simulations or target_standard_error is not None:
+        return utility_by_candidate
+    
+    for candidate_alpha, candidate_beta, utility in zip(candidate_alphas, candidate_betas, utility_by_candidate):
+        cache_key = get_utility_cache_key(
+            date,
+            forecast_one_ic,
+            strategy_profile.with_strategy(generator_idx, candidate_alpha, candidate_beta),
+            get_run_simulations_settings(
+                number_of_simulations,
+                number_of_generators,
+                generator_marginal_cost,
+                generator_capacity,
+                generator_id,
+                risk_aversion,
+                batched_simulations,
+                target_standard_error,
+                simulation_batch_size,
+                streaming_simulations
+            ),
+            common_random_numbers,
+            seed_sequence
+        )
+        if cache_key is None:
+            break
+        shared_utility_cache.put(cache_key, float(utility))
+    
+    return utility_by_candidate
+
 def calculate_utility(
     daily_returns_by_sim: np.ndarray,
-    risk_aversion: float
-) -> float:
-    mean_return = daily_returns_by_sim.mean()
-    variance_return = daily_returns_by_sim.var()
+    risk_aversion: float | np.ndarray,
+    axis: int = None
+) -> float | np.ndarray:
+    #Along axis 0 of a (simulations x generators) array, risk_aversion can hold one value per generator
+    mean_return = daily_returns_by_sim.mean(axis=axis)
+    variance_return = daily_returns_by_sim.var(axis=axis)
     
     utility = mean_return - risk_aversion * variance_return
     
     return utility
-    
+
 def run_day_simulations(
     date : str,
     number_of_simulations : int,
     number_of_generators : int,
     forecast_one_ic : pl.DataFrame,
-    alpha_by_generator : dict[str, float],
-    beta_by_generator : dict,
-    bid_capacity_by_generator : pl.DataFrame,
-    generator_marginal_cost : float,
-    generator_capacity : float,
-    generator_id : int
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    generator_capacity : float | np.ndarray,
+    generator_id : int,
+    common_random_numbers : bool = False,
+    seed_sequence : np.random.SeedSequence = None
 ) -> np.ndarray:
     
     forecast_one_day = forecast_one_ic.filter(pl.col(ct.ColumnNames.DATE.value) == date)
-    covariance_matrix = day_simulation.get_covariance_matrix_from_df(forecast_one_day)
+    forecast_error_sampler = day_simulation.get_forecast_error_sampler_from_df(forecast_one_day)
+    forecast_errors = get_forecast_errors(
+        forecast_one_day,
+        number_of_simulations,
+        number_of_generators,
+        common_random_numbers,
+        seed_sequence
+    )
+    rng = None if forecast_errors is not None else random_streams.get_batch_rng(seed_sequence)
+    
+    daily_returns_array = simulate_daily_returns(
+        forecast_one_day,
+        forecast_error_sampler,
+        number_of_simulations,
+        number_of_generators,
+        strategy_profile,
+        generator_marginal_cost,
+        generator_capacity,
+        generator_id,
+        forecast_errors,
+        rng
+    )
+    
+    return daily_returns_array
+
+def simulate_daily_returns(
+    forecast_one_day : pl.DataFrame,
+    forecast_error_sampler : fes.ForecastErrorSampler,
+    number_of_simulations : int,
+    number_of_generators : int,
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    generator_capacity : float | np.ndarray,
+    generator_id : int,
+    forecast_errors : np.ndarray = None,
+    rng : np.random.Generator = None
+) -> np.ndarray:
     daily_returns_array = np.zeros(number_of_simulations)
     for i in range(number_of_simulations):
         daily_returns_one_sim = day_simulation.simulate_day(
             forecast_one_day,
-            covariance_matrix,
+            forecast_error_sampler,
             number_of_generators,
-            alpha_by_generator,
-            beta_by_generator,
-            bid_capacity_by_generator,
+            strategy_profile,
             generator_marginal_cost,
             generator_capacity,
-            generator_id
+            generator_id,
+            None if forecast_errors is None else forecast_errors[i],
+            rng
         )
         daily_returns_array[i] = daily_returns_one_sim
     
-    return daily_returns_array
\ No newline at end of file
+    return daily_returns_array
+
+def run_day_simulations_batched(
+    date : str,
+    number_of_simulations : int,
+    number_of_generators : int,
+    forecast_one_ic : pl.DataFrame,
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    generator_capacity : float | np.ndarray,
+    generator_id : str,
+    common_random_numbers : bool = False,
+    seed_sequence : np.random.SeedSequence = None
+) -> np.ndarray:
+    
+    daily_returns_by_generator = run_day_simulations_all_generators(
+        date,
+        number_of_simulations,
+        number_of_generators,
+        forecast_one_ic,
+        strategy_profile,
+        generator_marginal_cost,
+        generator_capacity,
+        batched_simulations = True,
+        common_random_numbers = common_random_numbers,
+        seed_sequence = seed_sequence
+    )
+    daily_returns_array = daily_returns_by_generator[:, int(generator_id)]
+    
+    return daily_returns_array
+
+def run_day_simulations_all_generators(
+    date : str,
+    number_of_simulations : int,
+    number_of_generators : int,
+    forecast_one_ic : pl.DataFrame,
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    generator_capacity : float | np.ndarray,
+    batched_simulations : bool = False,
+    common_random_numbers : bool = False,
+    seed_sequence : np.random.SeedSequence = None
+) -> np.ndarray:
+    #Simulates each day's auctions once and returns a (simulations x generators) array of daily returns,
+    #so that every generator is evaluated against the same draws
+    forecast_one_day = forecast_one_ic.filter(pl.col(ct.ColumnNames.DATE.value) == date)
+    forecast_error_sampler = day_simulation.get_forecast_error_sampler_from_df(forecast_one_day)
+    forecast_errors = get_forecast_errors(
+        forecast_one_day,
+        number_of_simulations,
+        number_of_generators,
+        common_random_numbers,
+        seed_sequence
+    )
+    rng = None if forecast_errors is not None else random_streams.get_batch_rng(seed_sequence)
+    
+    daily_returns_by_generator = simulate_daily_returns_all_generators(
+        forecast_one_day,
+        forecast_error_sampler,
+        number_of_simulations,
+        number_of_generators,
+        strategy_profile,
+        generator_marginal_cost,
+        generator_capacity,
+        batched_simulations,
+        forecast_errors,
+        rng
+    )
+    
+    return daily_returns_by_generator
+
+def simulate_daily_returns_all_generators(
+    forecast_one_day : pl.DataFrame,
+    forecast_error_sampler : fes.ForecastErrorSampler,
+    number_of_simulations : int,
+    number_of_generators : int,
+    strategy_profile : sp.StrategyProfile,
+    generator_marginal_cost : float | np.ndarray,
+    generator_capacity : float | np.ndarray,
+    batched_simulations : bool,
+    forecast_errors : np.ndarray = None,
+    rng : np.random.Generator = None
+) -> np.ndarray:
+    if batched_simulations:
+        accepted_capacities, clearing_prices, actual_domestic_prices, actual_foreign_prices = day_simulation.simulate_auctions_batch(
+            forecast_one_day,
+            forecast_error_sampler,
+            number_of_simulations,
+            number_of_generators,
+            strategy_profile,
+            generator_marginal_cost,
+            forecast_errors,
+            rng
+        )
+        daily_returns_by_generator = day_simulation.calculate_daily_returns_batch(
+            accepted_capacities,
+            clearing_prices,
+            actual_domestic_prices,
+            actual_foreign_prices,
+            generator_capacity,
+            generator_marginal_cost
+        )
+        
+        return daily_returns_by_generator
+    
+    daily_returns_by_generator = np.zeros((number_of_simulations, number_of_generators))
+    for i in range(number_of_simulations):
+        auction_information_one_sim = day_simulation.get_auction_information_one_sim(
+            forecast_one_day,
+            forecast_error_sampler,
+            number_of_generators,
+            strategy_profile,
+            generator_marginal_cost,
+            None if forecast_errors is None else forecast_errors[i],
+            rng
+        )
+        for generator_id in range(number_of_generators):
+            daily_returns_by_generator[i, generator_id] = day_simulation.calculate_daily_return_for_generator_one_sim(
+                str(generator_id),
+                auction_information_one_sim,
+                generator_capacity,
+                generator_marginal_cost
+            )
+    
+    return daily_returns_by_generator
+
+def get_forecast_errors(
+    forecast_one_day : pl.DataFrame,
+    number_of_simulations : int,
+    number_of_generators : int,
+    common_random_numbers : bool,
+    seed_sequence : np.random.SeedSequence = None,
+    first_simulation : int = 0
+) -> np.ndarray | None:
+    #With common random numbers every evaluation on a day and stream reuses the same cached error blocks;
+    #otherwise the simulation draws fresh errors from a new child stream
+    if not common_random_numbers:
+        return None
+    
+    return day_simulation.get_common_forecast_errors_from_df(
+        forecast_one_day,
+        number_of_simulations,
+        number_of_generators,
+        seed_sequence,
+        first_simulation
+    )
+
+def get_utility_cache_key(
+    date : str,
+    forecast_one_ic : pl.DataFrame,
+    strategy_profile : sp.StrategyProfile,
+    settings : tuple,
+    common_random_numbers : bool,
+    seed_sequence : np.random.SeedSequence = None
+) -> bytes | None:
+    #Only evaluations against a common random number block from a known stream repeat exactly, so only those are cached
+    if not common_random_numbers or seed_sequence is None:
+        return None
+    
+    return shared_utility_cache.get_key(
+        date,
+        forecast_one_ic,
+        strategy_profile,
+        settings,
+        random_streams.get_stream_id(seed_sequence)
+    )
+
+def get_run_simulations_settings(
+    number_of_simulations : int,
+    number_of_generators : int,
+    generator_marginal_cost : float | np.ndarray,
+    generator_capacity : float | np.ndarray,
+    generator_id : str,
+    risk_aversion : float | np.ndarray,
+    batched_simulations : bool,
+    target_standard_error : float = None,
+    simulation_batch_size : int = 100,
+    streaming_simulations : bool = False
+) -> tuple:
+    #The batch size only changes the result when simulating adaptively or streaming
+    return (
+        "run_simulations",
+        number_of_simulations,
+        number_of_generators,
+        generator_marginal_cost,
+        generator_capacity,
+        str(generator_id),
+        risk_aversion,
+        batched_simulations,
+        target_standard_error,
+        simulation_batch_size if streaming_simulations or target_standard_error is not None else None
+    )
\ No newline at end of file
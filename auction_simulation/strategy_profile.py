@@ -0,0 +1,100 @@
+import numpy as np
+
+class StrategyProfile:
+    #Every generator's bidding strategy held in contiguous arrays: alpha and beta along the generator axis and
+    #capacity bids as (periods x generators), with periods in ascending delivery period order. The arrays are
+    #read-only, so an updated profile can share everything it does not change with the profile it came from.
+    #Generators are addressed by position; generator_ids only labels them in the strategies handed back to callers
+    def __init__(
+        self,
+        alphas: np.ndarray,
+        betas: np.ndarray,
+        capacity_bids: np.ndarray,
+        generator_ids: list[str] = None
+    ):
+        self.alphas = get_read_only_array(alphas)
+        self.betas = get_read_only_array(betas)
+        self.capacity_bids = get_read_only_array(capacity_bids)
+        self.number_of_generators = len(self.alphas)
+        self.generator_ids = get_generator_ids(self.number_of_generators, generator_ids)
+    
+    def get_generator_ids(self) -> list[str]:
+        return list(self.generator_ids)
+    
+    def with_strategy(
+        self,
+        generator_idx: int,
+        alpha: float,
+        beta: float
+    ) -> "StrategyProfile":
+        #Copies only the two strategy vectors; the capacity bids are shared
+        alphas = self.alphas.copy()
+        betas = self.betas.copy()
+        alphas[generator_idx] = alpha
+        betas[generator_idx] = beta
+        
+        return StrategyProfile(alphas, betas, self.capacity_bids, self.generator_ids)
+    
+    def with_symmetric_strategy(
+        self,
+        alpha: float,
+        beta: float
+    ) -> "StrategyProfile":
+        alphas = np.full(self.number_of_generators, alpha, dtype=np.float64)
+        betas = np.full(self.number_of_generators, beta, dtype=np.float64)
+        
+        return StrategyProfile(alphas, betas, self.capacity_bids, self.generator_ids)
+    
+    def is_symmetric(self) -> bool:
+        #Every generator plays the same strategy and bids the same capacity in each period
+        is_symmetric = (
+            (self.alphas == self.alphas[0]).all()
+            and (self.betas == self.betas[0]).all()
+            and (self.capacity_bids == self.capacity_bids[:, :1]).all()
+        )
+        
+        return bool(is_symmetric)
+    
+    def get_alpha_by_generator(self) -> dict[str, float]:
+        return dict(zip(self.get_generator_ids(), self.alphas.tolist()))
+    
+    def get_beta_by_generator(self) -> dict[str, float]:
+        return dict(zip(self.get_generator_ids(), self.betas.tolist()))
+
+def get_initial_strategy_profile(
+    number_of_generators: int,
+    number_of_periods: int,
+    generator_capacity: float | np.ndarray,
+    initial_alpha_by_generator: dict[str, float] = None,
+    initial_beta_by_generator: dict[str, float] = None,
+    generator_ids: list[str] = None
+) -> StrategyProfile:
+    #Truthful bidding (alpha 0, beta 1) with a fifth of each generator's capacity offered in every period, unless seed strategies are given.
+    #Seed strategies are matched on generator id, and a generator without one starts from truthful bidding
+    generator_ids = get_generator_ids(number_of_generators, generator_ids)
+    if initial_alpha_by_generator is None or initial_beta_by_generator is None:
+        alphas = np.zeros(number_of_generators)
+        betas = np.ones(number_of_generators)
+    else:
+        alphas = np.array([initial_alpha_by_generator.get(generator_id, 0.0) for generator_id in generator_ids], dtype=np.float64)
+        betas = np.array([initial_beta_by_generator.get(generator_id, 1.0) for generator_id in generator_ids], dtype=np.float64)
+    capacity_bids = np.full((number_of_periods, number_of_generators), generator_capacity/5, dtype=np.float64)
+    
+    return StrategyProfile(alphas, betas, capacity_bids, generator_ids)
+
+def get_generator_ids(
+    number_of_generators: int,
+    generator_ids: list[str] = None
+) -> tuple[str, ...]:
+    #Without ids from a generator portfolio, generators are labelled by position
+    if generator_ids is None:
+        return tuple(str(i) for i in range(number_of_generators))
+    
+    return tuple(str(generator_id) for generator_id in generator_ids)
+
+def get_read_only_array(array: np.ndarray) -> np.ndarray:
+    #A read-only view, so the caller's own array stays writeable
+    read_only_array = np.ascontiguousarray(array, dtype=np.float64).view()
+    read_only_array.setflags(write=False)
+    
+    return read_only_array
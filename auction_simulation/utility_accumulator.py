@@ -0,0 +1,87 @@
+import numpy as np
+
+class UtilityAccumulator:
+    #Running central moments of daily returns, updated one batch at a time with the pairwise (Welford / Pebay)
+    #formulas so the returns themselves never need to be kept. Works elementwise, so shape=(G,) tracks
+    #one accumulator per generator. The third and fourth moments give the standard error of the utility
+    def __init__(
+        self,
+        risk_aversion: float,
+        shape: tuple[int, ...] = ()
+    ):
+        self.risk_aversion = risk_aversion
+        self.count = 0
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+        self.m3 = np.zeros(shape)
+        self.m4 = np.zeros(shape)
+    
+    def add_batch(
+        self,
+        daily_returns: np.ndarray
+    ) -> None:
+        #Simulations lie along axis 0
+        daily_returns = np.asarray(daily_returns, dtype=np.float64)
+        if len(daily_returns) == 0:
+            return
+        
+        batch = UtilityAccumulator(self.risk_aversion, self.mean.shape)
+        batch.count = len(daily_returns)
+        batch.mean = daily_returns.mean(axis=0)
+        deviations = daily_returns - batch.mean
+        batch.m2 = (deviations ** 2).sum(axis=0)
+        batch.m3 = (deviations ** 3).sum(axis=0)
+        batch.m4 = (deviations ** 4).sum(axis=0)
+        self.merge(batch)
+    
+    def merge(
+        self,
+        other: "UtilityAccumulator"
+    ) -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count = other.count
+            self.mean, self.m2, self.m3, self.m4 = other.mean.copy(), other.m2.copy(), other.m3.copy(), other.m4.copy()
+            return
+        
+        count_a, count_b = self.count, other.count
+        count = count_a + count_b
+        delta = other.mean - self.mean
+        
+        m4 = (
+            self.m4 + other.m4
+            + delta ** 4 * count_a * count_b * (count_a ** 2 - count_a * count_b + count_b ** 2) / count ** 3
+            + 6 * delta ** 2 * (count_a ** 2 * other.m2 + count_b ** 2 * self.m2) / count ** 2
+            + 4 * delta * (count_a * other.m3 - count_b * self.m3) / count
+        )
+        m3 = (
+            self.m3 + other.m3
+            + delta ** 3 * count_a * count_b * (count_a - count_b) / count ** 2
+            + 3 * delta * (count_a * other.m2 - count_b * self.m2) / count
+        )
+        m2 = self.m2 + other.m2 + delta ** 2 * count_a * count_b / count
+        
+        self.count = count
+        self.mean = self.mean + delta * count_b / count
+        self.m2, self.m3, self.m4 = m2, m3, m4
+    
+    def get_variance(self) -> np.ndarray:
+        #Population variance, as np.var
+        return self.m2 / self.count
+    
+    def get_utility(self) -> np.ndarray:
+        return self.mean - self.risk_aversion * self.get_variance()
+    
+    def get_standard_error(self) -> np.ndarray:
+        #Delta-method standard error of mean - risk_aversion * variance
+        variance = self.get_variance()
+        third_moment = self.m3 / self.count
+        fourth_moment = self.m4 / self.count
+        utility_variance = (
+            variance
+            - 2 * self.risk_aversion * third_moment
+            + self.risk_aversion ** 2 * (fourth_moment - variance ** 2)
+        ) / self.count
+        
+        return np.sqrt(np.maximum(utility_variance, 0))
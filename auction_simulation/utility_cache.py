@@ -0,0 +1,78 @@
+import hashlib
+import numpy as np
+import polars as pl
+
+from collections import OrderedDict
+
+class UtilityCache:
+    #Bounded least-recently-used store of utility results. Keys are digests of everything that determines a
+    #result, so a hit returns exactly what re-running the simulation would have returned
+    def __init__(
+        self,
+        maximum_size: int = 4096,
+        decimals: int = 9
+    ):
+        self.maximum_size = maximum_size
+        self.decimals = decimals
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_key(
+        self,
+        date,
+        forecast_one_ic: pl.DataFrame,
+        strategy_profile,
+        settings: tuple,
+        stream_id: tuple
+    ) -> bytes:
+        #The strategy profile is rounded so that floating-point noise in the search does not defeat the cache.
+        #Per-generator settings arrays are written out in full, since an array's repr abbreviates its values
+        settings = tuple(setting.tolist() if isinstance(setting, np.ndarray) else setting for setting in settings)
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(repr((str(date), settings, stream_id)).encode())
+        key_hash.update(forecast_one_ic.hash_rows().to_numpy().tobytes())
+        key_hash.update(np.round(strategy_profile.alphas, self.decimals).tobytes())
+        key_hash.update(np.round(strategy_profile.betas, self.decimals).tobytes())
+        key_hash.update(strategy_profile.capacity_bids.tobytes())
+        
+        return key_hash.digest()
+    
+    def get(
+        self,
+        key: bytes
+    ):
+        if key not in self.results:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        self.results.move_to_end(key)
+        
+        return self.results[key]
+    
+    def put(
+        self,
+        key: bytes,
+        result
+    ) -> None:
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if len(self.results) > self.maximum_size:
+            self.results.popitem(last=False)
+    
+    def get_statistics(self) -> dict[str, float]:
+        number_of_lookups = self.hits + self.misses
+        statistics = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / number_of_lookups if number_of_lookups > 0 else 0.0,
+            "size": len(self.results)
+        }
+        
+        return statistics
+    
+    def clear(self) -> None:
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
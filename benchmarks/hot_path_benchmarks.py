@@ -0,0 +1,217 @@
+import json
+import time
+import platform
+import datetime
+import numpy as np
+import polars as pl
+import constants as ct
+import auction_simulation.day_simulation as day_simulation
+import auction_simulation.simulation_engine as simulation_engine
+import optimisation.optimiser as optimiser
+import benchmarks.synthetic_data as synthetic_data
+
+number_of_periods = 48
+number_of_generators = 10
+number_of_simulations = 100
+generator_marginal_cost = 40
+generator_capacity = 1000
+risk_aversion = 1
+number_of_repeats = 5
+optimisation_tolerance = 0.1
+initial_random_evaluations = 2
+number_of_optimisation_iterations = 2
+maximum_sweeps = 3  #Caps the equilibrium search so the optimisation benchmark does a fixed amount of work
+output_filepath = 'benchmark_results.json'
+baseline_filepath = None
+
+def run_benchmarks(
+    number_of_periods: int,
+    number_of_generators: int,
+    number_of_simulations: int,
+    generator_marginal_cost: float,
+    generator_capacity: float,
+    risk_aversion: float,
+    number_of_repeats: int,
+    optimisation_tolerance: float,
+    initial_random_evaluations: int,
+    number_of_optimisation_iterations: int,
+    output_filepath: str = None,
+    include_optimisation: bool = True,
+    maximum_sweeps: int = 3
+) -> dict:
+    forecasts = synthetic_data.get_synthetic_forecasts(1, number_of_periods)
+    date = forecasts[ct.ColumnNames.DATE.value][0]
+    strategy_profile = synthetic_data.get_synthetic_strategy_profile(forecasts, number_of_generators, generator_capacity)
+    forecast_error_sampler = day_simulation.get_forecast_error_sampler_from_df(forecasts)
+    np.random.seed(0)
+    
+    benchmark_results = {}
+    
+    auction_information_one_day = day_simulation.get_auction_information_one_sim(
+        forecasts,
+        forecast_error_sampler,
+        number_of_generators,
+        strategy_profile,
+        generator_marginal_cost
+    )
+    for benchmark_name, auction_function in (
+        ("run_auction", auction_information_one_day.run_auction),
+        ("run_auction_batch", auction_information_one_day.run_auction_batch)
+    ):
+        seconds_per_call = time_function(auction_function, number_of_repeats)
+        benchmark_results[benchmark_name] = {
+            "seconds_per_call": seconds_per_call,
+            "auctions_per_second": number_of_periods / seconds_per_call
+        }
+    
+    def simulate_day():
+        return day_simulation.simulate_day(
+            forecasts,
+            forecast_error_sampler,
+            number_of_generators,
+            strategy_profile,
+            generator_marginal_cost,
+            generator_capacity,
+            "0"
+        )
+    
+    seconds_per_call = time_function(simulate_day, number_of_repeats)
+    benchmark_results["simulate_day"] = {
+        "seconds_per_call": seconds_per_call,
+        "simulations_per_second": 1 / seconds_per_call,
+        "auctions_per_second": number_of_periods / seconds_per_call
+    }
+    
+    for benchmark_name, batched_simulations in (("run_simulations", False), ("run_simulations_batched", True)):
+        def run_simulations():
+            return simulation_engine.run_simulations(
+                date,
+                number_of_simulations,
+                number_of_generators,
+                forecasts,
+                strategy_profile,
+                generator_marginal_cost,
+                generator_capacity,
+                "0",
+                risk_aversion,
+                batched_simulations
+            )
+        
+        seconds_per_call = time_function(run_simulations, number_of_repeats)
+        benchmark_results[benchmark_name] = {
+            "seconds_per_call": seconds_per_call,
+            "simulations_per_second": number_of_simulations / seconds_per_call,
+            "auctions_per_second": number_of_simulations * number_of_periods / seconds_per_call
+        }
+    
+    if include_optimisation:
+        def run_optimisation_for_day():
+            return optimiser.run_optimisation_for_day(
+                date,
+                number_of_simulations,
+                forecasts,
+                generator_marginal_cost,
+                generator_capacity,
+                number_of_generators,
+                risk_aversion,
+                optimisation_tolerance,
+                initial_random_evaluations,
+                number_of_optimisation_iterations,
+                True,
+                True,
+                True,
+                maximum_sweeps = maximum_sweeps
+            )
+        
+        #A full equilibrium search is slow, so it is only timed once
+        seconds_per_call = time_function(run_optimisation_for_day, 1)
+        benchmark_results["run_optimisation_for_day"] = {
+            "seconds_per_call": seconds_per_call,
+            "days_per_hour": 3600 / seconds_per_call
+        }
+    
+    benchmark_run = {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "polars": pl.__version__,
+            "machine": platform.machine()
+        },
+        "configuration": {
+            "number_of_periods": number_of_periods,
+            "number_of_generators": number_of_generators,
+            "number_of_simulations": number_of_simulations,
+            "number_of_repeats": number_of_repeats,
+            "maximum_sweeps": maximum_sweeps
+        },
+        "results": benchmark_results
+    }
+    
+    if output_filepath is not None:
+        with open(output_filepath, "w") as output_file:
+            json.dump(benchmark_run, output_file, indent=4)
+    
+    return benchmark_run
+
+def time_function(
+    function,
+    number_of_repeats: int
+) -> float:
+    #Median wall time of repeated calls, after one untimed warm-up call
+    function()
+    timings = []
+    for _ in range(number_of_repeats):
+        start_time = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start_time)
+    
+    return float(np.median(timings))
+
+def compare_benchmark_results(
+    baseline_filepath: str,
+    candidate_filepath: str,
+    regression_threshold: float = 0.1
+) -> list[str]:
+    #Compares seconds per call for each benchmark, and returns those that slowed down by more than the threshold
+    with open(baseline_filepath) as baseline_file:
+        baseline_results = json.load(baseline_file)["results"]
+    with open(candidate_filepath) as candidate_file:
+        candidate_results = json.load(candidate_file)["results"]
+    
+    regressions = []
+    for benchmark_name, candidate_result in candidate_results.items():
+        if benchmark_name not in baseline_results:
+            continue
+        speed_up = baseline_results[benchmark_name]["seconds_per_call"] / candidate_result["seconds_per_call"]
+        print(f"{benchmark_name}: {speed_up:.2f}x relative to baseline")
+        if speed_up < 1 - regression_threshold:
+            regressions.append(benchmark_name)
+    
+    return regressions
+
+def main():
+    benchmark_run = run_benchmarks(
+        number_of_periods,
+        number_of_generators,
+        number_of_simulations,
+        generator_marginal_cost,
+        generator_capacity,
+        risk_aversion,
+        number_of_repeats,
+        optimisation_tolerance,
+        initial_random_evaluations,
+        number_of_optimisation_iterations,
+        output_filepath,
+        maximum_sweeps = maximum_sweeps
+    )
+    for benchmark_name, benchmark_result in benchmark_run["results"].items():
+        print(f"{benchmark_name}: {benchmark_result}")
+    
+    if baseline_filepath is not None:
+        regressions = compare_benchmark_results(baseline_filepath, output_filepath)
+        if regressions:
+            print(f"Regressions against baseline: {', '.join(regressions)}")
+
+if __name__ == "__main__":
+    main()
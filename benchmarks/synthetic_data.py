@@ -0,0 +1,49 @@
+import datetime
+import numpy as np
+import polars as pl
+import constants as ct
+import auction_simulation.strategy_profile as sp
+
+def get_synthetic_forecasts(
+    number_of_days: int,
+    number_of_periods: int,
+    random_seed: int = 0
+) -> pl.DataFrame:
+    #Forecast frame with the same columns as the naive forecasts, filled with plausible prices and error statistics
+    rng = np.random.default_rng(random_seed)
+    number_of_rows = number_of_days * number_of_periods
+    dates = [datetime.date(2024, 1, 1) + datetime.timedelta(days=day) for day in range(number_of_days)]
+    
+    forecast_domestic_prices = 60 + 15 * rng.standard_normal(number_of_rows)
+    forecast_foreign_prices = 55 + 15 * rng.standard_normal(number_of_rows)
+    synthetic_forecasts = pl.DataFrame(
+        {
+            ct.ColumnNames.DATE.value: pl.Series([date for date in dates for _ in range(number_of_periods)], dtype=pl.Date),
+            ct.ColumnNames.DELIVERY_PERIOD.value: np.tile(np.arange(1, number_of_periods + 1), number_of_days),
+            ct.ColumnNames.AVAILABLE_CAPACITY.value: rng.choice([500.0, 1000.0, 2000.0], size=number_of_rows),
+            ct.ColumnNames.DOMESTIC_PRICE.value: forecast_domestic_prices + 10 * rng.standard_normal(number_of_rows),
+            ct.ColumnNames.FOREIGN_PRICE.value: forecast_foreign_prices + 10 * rng.standard_normal(number_of_rows),
+            ct.ColumnNames.FORECAST_DOMESTIC_PRICE.value: forecast_domestic_prices,
+            ct.ColumnNames.FORECAST_FOREIGN_PRICE.value: forecast_foreign_prices,
+            ct.ColumnNames.DOMESTIC_FORECAST_ERROR_STDEV.value: np.repeat(rng.uniform(5, 15, number_of_days), number_of_periods),
+            ct.ColumnNames.FOREIGN_FORECAST_ERROR_STDEV.value: np.repeat(rng.uniform(5, 15, number_of_days), number_of_periods),
+            ct.ColumnNames.FORECAST_ERROR_CORRELATIONS.value: np.repeat(rng.uniform(0.2, 0.8, number_of_days), number_of_periods)
+        }
+    )
+    
+    return synthetic_forecasts
+
+def get_synthetic_strategy_profile(
+    forecast_one_day: pl.DataFrame,
+    number_of_generators: int,
+    generator_capacity: float,
+    random_seed: int = 0
+) -> sp.StrategyProfile:
+    rng = np.random.default_rng(random_seed)
+    strategy_profile = sp.StrategyProfile(
+        rng.uniform(-1, 1, number_of_generators),
+        rng.uniform(0.5, 1.5, number_of_generators),
+        np.full((len(forecast_one_day), number_of_generators), generator_capacity/5)
+    )
+    
+    return strategy_profile
\ No newline at end of file
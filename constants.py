@@ -8,22 +8,53 @@ ic_name_to_source_country_dict = {
 }
 
 class ColumnNames(Enum):
+    ALPHA = "alpha"
+    ALPHA_CHANGE = "alpha_change"
     AVAILABLE_CAPACITY = "available_capacity"
+    BETA = "beta"
+    BETA_CHANGE = "beta_change"
+    CAPACITY = "capacity"
     CLEARING_PRICE = "clearing_price"
+    CONVERGED = "converged"
     DATE = "date"
     DELIVERY_PERIOD = "delivery_period"
     DOMESTIC_FORECAST_ERROR = "domestic_forecast_error"
     DOMESTIC_FORECAST_ERROR_STDEV = "domestic_forecast_error_stdev"
     DOMESTIC_PRICE = "domestic_price"
+    ELAPSED_SECONDS = "elapsed_seconds"
     FORECAST_DOMESTIC_PRICE = "forecast_domestic_price"
     FORECAST_ERROR_CORRELATIONS = "forecast_error_correlations"
     FORECAST_FOREIGN_PRICE = "forecast_foreign_price"
     FOREIGN_FORECAST_ERROR = "foreign_forecast_error"
     FOREIGN_FORECAST_ERROR_STDEV = "foreign_forecast_error_stdev"
     FOREIGN_PRICE = "foreign_price"
+    GENERATOR_ID = "generator_id"
+    MARGINAL_COST = "marginal_cost"
+    RISK_AVERSION = "risk_aversion"
     ROLLING_CORRELATION = "rolling_correlation"
+    SELECTED = "selected"
     SETTLEMENT_PERIOD = "settlement_period"
+    SWEEP = "sweep"
+    SWEEP_SECONDS = "sweep_seconds"
+    UTILITY = "utility"
+    UTILITY_CHANGE = "utility_change"
+    UTILITY_EVALUATIONS = "utility_evaluations"
     
+class CheckpointFileSuffixes(Enum):
+    CLEARING_PRICES = "_clearing_prices.parquet"
+    STRATEGIES = "_strategies.parquet"
+    CONVERGENCE_TRACE = "_convergence_trace.parquet"
+
+class StrategySearchMethods(Enum):
+    BAYESIAN_OPTIMISATION = "bayesian_optimisation"
+    CMA_ES = "cma_es"
+    GRID = "grid"
+
+class SweepMethods(Enum):
+    GAUSS_SEIDEL = "gauss_seidel"
+    JACOBI = "jacobi"
+    SYMMETRIC = "symmetric"
+
 class NumericalConstants(Enum):
     DEFAULT_UTILITY = -1e10
     
\ No newline at end of file
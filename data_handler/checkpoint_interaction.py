@@ -0,0 +1,114 @@
+import os
+import polars as pl
+import constants as ct
+
+#Each finished day is written as Parquet files named after the date: its strategies, its convergence trace and its
+#clearing prices. The clearing prices file is written last, via an atomic rename, so its presence marks the day as complete
+
+def get_completed_dates(
+    checkpoint_directory: str
+) -> set[str]:
+    if not os.path.isdir(checkpoint_directory):
+        return set()
+    
+    completed_dates = {
+        filename.removesuffix(ct.CheckpointFileSuffixes.CLEARING_PRICES.value)
+        for filename in os.listdir(checkpoint_directory)
+        if filename.endswith(ct.CheckpointFileSuffixes.CLEARING_PRICES.value)
+    }
+    
+    return completed_dates
+
+def write_day_results(
+    checkpoint_directory: str,
+    date,
+    clearing_prices_df: pl.DataFrame,
+    alpha_by_generator: dict[str, float],
+    beta_by_generator: dict[str, float],
+    convergence_trace_df: pl.DataFrame = None
+) -> None:
+    os.makedirs(checkpoint_directory, exist_ok=True)
+    strategies_df = pl.DataFrame(
+        {
+            ct.ColumnNames.DATE.value: [date] * len(alpha_by_generator),
+            ct.ColumnNames.GENERATOR_ID.value: list(alpha_by_generator.keys()),
+            ct.ColumnNames.ALPHA.value: [float(alpha_by_generator[generator_id]) for generator_id in alpha_by_generator],
+            ct.ColumnNames.BETA.value: [float(beta_by_generator[generator_id]) for generator_id in alpha_by_generator]
+        }
+    )
+    
+    write_parquet_atomically(
+        strategies_df,
+        get_checkpoint_filepath(checkpoint_directory, date, ct.CheckpointFileSuffixes.STRATEGIES.value)
+    )
+    if convergence_trace_df is not None:
+        write_parquet_atomically(
+            convergence_trace_df,
+            get_checkpoint_filepath(checkpoint_directory, date, ct.CheckpointFileSuffixes.CONVERGENCE_TRACE.value)
+        )
+    write_parquet_atomically(
+        clearing_prices_df,
+        get_checkpoint_filepath(checkpoint_directory, date, ct.CheckpointFileSuffixes.CLEARING_PRICES.value)
+    )
+
+def read_day_clearing_prices(
+    checkpoint_directory: str,
+    date
+) -> pl.DataFrame:
+    return pl.read_parquet(
+        get_checkpoint_filepath(checkpoint_directory, date, ct.CheckpointFileSuffixes.CLEARING_PRICES.value)
+    )
+
+def read_day_strategies(
+    checkpoint_directory: str,
+    date
+) -> tuple[dict[str, float], dict[str, float]]:
+    strategies_df = pl.read_parquet(
+        get_checkpoint_filepath(checkpoint_directory, date, ct.CheckpointFileSuffixes.STRATEGIES.value)
+    )
+    generator_ids = strategies_df[ct.ColumnNames.GENERATOR_ID.value].to_list()
+    alpha_by_generator = dict(zip(generator_ids, strategies_df[ct.ColumnNames.ALPHA.value].to_list()))
+    beta_by_generator = dict(zip(generator_ids, strategies_df[ct.ColumnNames.BETA.value].to_list()))
+    
+    return alpha_by_generator, beta_by_generator
+
+def read_day_convergence_trace(
+    checkpoint_directory: str,
+    date
+) -> pl.DataFrame | None:
+    #None for days checkpointed before convergence traces were written
+    convergence_trace_filepath = get_checkpoint_filepath(checkpoint_directory, date, ct.CheckpointFileSuffixes.CONVERGENCE_TRACE.value)
+    if not os.path.exists(convergence_trace_filepath):
+        return None
+    
+    return pl.read_parquet(convergence_trace_filepath)
+
+def read_convergence_traces(
+    checkpoint_directory: str
+) -> pl.DataFrame:
+    #Every day's trace in date order, for weighing the convergence tolerance against its cost
+    convergence_trace_filenames = sorted(
+        filename for filename in os.listdir(checkpoint_directory)
+        if filename.endswith(ct.CheckpointFileSuffixes.CONVERGENCE_TRACE.value)
+    )
+    convergence_trace_df = pl.concat(
+        [pl.read_parquet(os.path.join(checkpoint_directory, filename)) for filename in convergence_trace_filenames],
+        how="vertical_relaxed"
+    )
+    
+    return convergence_trace_df
+
+def get_checkpoint_filepath(
+    checkpoint_directory: str,
+    date,
+    suffix: str
+) -> str:
+    return os.path.join(checkpoint_directory, f"{date}{suffix}")
+
+def write_parquet_atomically(
+    df: pl.DataFrame,
+    filepath: str
+) -> None:
+    temporary_filepath = f"{filepath}.tmp"
+    df.write_parquet(temporary_filepath)
+    os.replace(temporary_filepath, filepath)
@@ -0,0 +1,39 @@
+import os
+import polars as pl
+import constants as ct
+
+#A generator portfolio is a table with one row per generator: its id, marginal cost, capacity and risk aversion.
+#It can be an Excel workbook (first sheet) or a CSV file
+
+portfolio_columns = [
+    ct.ColumnNames.GENERATOR_ID.value,
+    ct.ColumnNames.MARGINAL_COST.value,
+    ct.ColumnNames.CAPACITY.value,
+    ct.ColumnNames.RISK_AVERSION.value
+]
+
+def read_generator_portfolio(
+    filepath: str
+) -> pl.DataFrame:
+    if os.path.splitext(filepath)[1].lower() in (".xlsx", ".xlsm", ".xls"):
+        portfolio_df = pl.read_excel(filepath)
+    else:
+        portfolio_df = pl.read_csv(filepath)
+    
+    missing_columns = [column for column in portfolio_columns if column not in portfolio_df.columns]
+    if missing_columns:
+        raise ValueError(f"Generator portfolio {filepath} is missing columns {missing_columns}")
+    
+    #Strategies are saved and warm-started by generator id, so each id must name exactly one generator
+    duplicate_ids = portfolio_df.filter(pl.col(ct.ColumnNames.GENERATOR_ID.value).is_duplicated())[ct.ColumnNames.GENERATOR_ID.value].unique().to_list()
+    if duplicate_ids:
+        raise ValueError(f"Generator portfolio {filepath} has duplicate generator ids {duplicate_ids}")
+    
+    portfolio_df = portfolio_df.select(
+        pl.col(ct.ColumnNames.GENERATOR_ID.value).cast(pl.Utf8),
+        pl.col(ct.ColumnNames.MARGINAL_COST.value).cast(pl.Float64),
+        pl.col(ct.ColumnNames.CAPACITY.value).cast(pl.Float64),
+        pl.col(ct.ColumnNames.RISK_AVERSION.value).cast(pl.Float64)
+    )
+    
+    return portfolio_df
@@ -1,6 +1,16 @@
+import os
+import functools
+import polars as pl
+import constants as ct
 import data_handler.excel_interaction as excel_interaction
+import data_handler.portfolio_interaction as portfolio_interaction
 import price_forecaster.naive_forecast as naive
 import optimisation.optimisation_engine as optimisation_engine
+import optimisation.process_pool as process_pool
+import auction_simulation.random_streams as random_streams
+import auction_simulation.generator_portfolio as generator_portfolio
+
+from concurrent.futures import as_completed
 
 def run(
     read_in_filepath : str,
@@ -13,32 +23,172 @@ def run(
     optimisation_tolerance : float,
     initial_random_evaluations : int,
     number_of_optimisation_iterations : int,
-    output_filepath : str
+    output_filepath : str,
+    batched_simulations : bool = False,
+    shared_simulations : bool = False,
+    common_random_numbers : bool = False,
+    number_of_processes : int = 1,
+    random_seed : int = None,
+    number_of_interconnector_processes : int = 1,
+    checkpoint_directory : str = None,
+    strategy_search_method : str = ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value,
+    search_population_size : int = 16,
+    warm_start : bool = False,
+    warm_start_box_fraction : float = 0.4,
+    target_standard_error : float = None,
+    simulation_batch_size : int = 100,
+    streaming_simulations : bool = False,
+    number_of_evaluation_processes : int = 1,
+    evaluation_batch_size : int = 1,
+    sweep_method : str = ct.SweepMethods.GAUSS_SEIDEL.value,
+    damping : float = 1.0,
+    maximum_sweeps : int = None,
+    time_budget_seconds : float = None,
+    generator_portfolio_filepath : str = None
 ) -> None:
+    #A portfolio file replaces the identical generators with one set of parameters per generator, passed down as arrays,
+    #and its generator ids label the strategies in checkpoints and convergence traces
+    generator_ids = None
+    if generator_portfolio_filepath is not None:
+        fleet = generator_portfolio.get_generator_portfolio_from_df(
+            portfolio_interaction.read_generator_portfolio(generator_portfolio_filepath)
+        )
+        number_of_generators = fleet.number_of_generators
+        generator_marginal_cost = fleet.marginal_costs
+        generator_capacity = fleet.capacities
+        risk_aversion = fleet.risk_aversions
+        generator_ids = fleet.generator_ids
     raw_data_dfs = excel_interaction.read_in_excel_data(read_in_filepath)
     naive_forecasts = naive.get_naive_forecasts(
         raw_data_dfs,
         rolling_window_days
     )
+    run_optimisation_for_ic = functools.partial(
+        optimisation_engine.run_optimisation,
+        number_of_simulations = number_of_simulations,
+        number_of_generators = number_of_generators,
+        generator_marginal_cost = generator_marginal_cost,
+        generator_capacity = generator_capacity,
+        risk_aversion = risk_aversion,
+        optimisation_tolerance = optimisation_tolerance,
+        initial_random_evaluations = initial_random_evaluations,
+        number_of_optimisation_iterations = number_of_optimisation_iterations,
+        batched_simulations = batched_simulations,
+        shared_simulations = shared_simulations,
+        common_random_numbers = common_random_numbers,
+        number_of_processes = number_of_processes,
+        strategy_search_method = strategy_search_method,
+        search_population_size = search_population_size,
+        warm_start = warm_start,
+        warm_start_box_fraction = warm_start_box_fraction,
+        target_standard_error = target_standard_error,
+        simulation_batch_size = simulation_batch_size,
+        streaming_simulations = streaming_simulations,
+        number_of_evaluation_processes = number_of_evaluation_processes,
+        evaluation_batch_size = evaluation_batch_size,
+        sweep_method = sweep_method,
+        damping = damping,
+        maximum_sweeps = maximum_sweeps,
+        time_budget_seconds = time_budget_seconds,
+        generator_ids = generator_ids
+    )
+    #Interconnectors with the same source country have identical forecasts, so each distinct forecast is solved once
+    interconnectors_by_forecast = group_interconnectors_by_forecast(naive_forecasts)
+    #One child random stream per interconnector, assigned in input order so it does not depend on the grouping
+    seed_sequence_by_ic = dict(zip(
+        naive_forecasts,
+        random_streams.get_seed_sequence(random_seed).spawn(len(naive_forecasts))
+    ))
+    
     clearing_prices_by_ic = {}
-    for str, naive_forecast in naive_forecasts.items():
-        clearing_prices = optimisation_engine.run_optimisation(
-            number_of_simulations,
-            number_of_generators,
-            naive_forecast,
-            generator_marginal_cost,
-            generator_capacity,
-            risk_aversion,
-            optimisation_tolerance,
-            initial_random_evaluations,
-            number_of_optimisation_iterations
-        )
-        clearing_prices_by_ic[str] = clearing_prices
-        print(f"Clearing prices for {str} calculated.")
+    convergence_trace_by_ic = {}
+    if number_of_interconnector_processes > 1:
+        with process_pool.get_process_pool_executor(number_of_interconnector_processes) as executor:
+            futures = {
+                executor.submit(
+                    run_optimisation_for_ic,
+                    forecasts=naive_forecasts[ic],
+                    random_seed=seed_sequence_by_ic[ic],
+                    checkpoint_directory=get_checkpoint_directory_for_ic(checkpoint_directory, ic)
+                ): ic for ic in interconnectors_by_forecast
+            }
+            for future in as_completed(futures):
+                ic = futures[future]
+                clearing_prices, convergence_trace_df = future.result()
+                record_clearing_prices(
+                    clearing_prices_by_ic,
+                    convergence_trace_by_ic,
+                    interconnectors_by_forecast[ic],
+                    clearing_prices,
+                    convergence_trace_df
+                )
+    else:
+        for ic, interconnectors in interconnectors_by_forecast.items():
+            clearing_prices, convergence_trace_df = run_optimisation_for_ic(
+                forecasts=naive_forecasts[ic],
+                random_seed=seed_sequence_by_ic[ic],
+                checkpoint_directory=get_checkpoint_directory_for_ic(checkpoint_directory, ic)
+            )
+            record_clearing_prices(
+                clearing_prices_by_ic,
+                convergence_trace_by_ic,
+                interconnectors,
+                clearing_prices,
+                convergence_trace_df
+            )
     
     excel_interaction.write_data_to_excel(
-        clearing_prices_by_ic,
+        {ic: clearing_prices_by_ic[ic] for ic in naive_forecasts},
         output_filepath
     )
+    excel_interaction.write_data_to_excel(
+        {ic: convergence_trace_by_ic[ic] for ic in naive_forecasts},
+        get_convergence_trace_filepath(output_filepath)
+    )
+
+def group_interconnectors_by_forecast(
+    naive_forecasts : dict[str, pl.DataFrame]
+) -> dict[str, list[str]]:
+    interconnectors_by_forecast = {}
+    for ic, naive_forecast in naive_forecasts.items():
+        matching_ic = next(
+            (representative_ic for representative_ic in interconnectors_by_forecast
+             if naive_forecasts[representative_ic].equals(naive_forecast)),
+            None
+        )
+        if matching_ic is None:
+            interconnectors_by_forecast[ic] = [ic]
+        else:
+            interconnectors_by_forecast[matching_ic].append(ic)
+    
+    return interconnectors_by_forecast
+
+def record_clearing_prices(
+    clearing_prices_by_ic : dict[str, pl.DataFrame],
+    convergence_trace_by_ic : dict[str, pl.DataFrame],
+    interconnectors : list[str],
+    clearing_prices : pl.DataFrame,
+    convergence_trace_df : pl.DataFrame
+) -> None:
+    for ic in interconnectors:
+        clearing_prices_by_ic[ic] = clearing_prices
+        convergence_trace_by_ic[ic] = convergence_trace_df
+        if ic == interconnectors[0]:
+            print(f"Clearing prices for {ic} calculated.")
+        else:
+            print(f"Clearing prices for {ic} reused from {interconnectors[0]}.")
+
+def get_checkpoint_directory_for_ic(
+    checkpoint_directory : str,
+    ic : str
+) -> str:
+    if checkpoint_directory is None:
+        return None
+    
+    return os.path.join(checkpoint_directory, ic)
+
+def get_convergence_trace_filepath(output_filepath : str) -> str:
+    #Written alongside the clearing prices, with one sheet per interconnector
+    output_root, output_extension = os.path.splitext(output_filepath)
     
-    
\ No newline at end of file
+    return f"{output_root}_convergence_trace{output_extension}"
\ No newline at end of file
@@ -2,65 +2,318 @@ import numpy as np
 import polars as pl
 import constants as ct
 import optimisation.optimiser as optimiser
+import optimisation.process_pool as process_pool
 import auction_simulation.day_simulation as day_simulation
+import auction_simulation.random_streams as random_streams
+import data_handler.checkpoint_interaction as checkpoint_interaction
+
+from concurrent.futures import as_completed
 
 def run_optimisation(
     number_of_simulations: int,
     number_of_generators: int,
     forecasts: pl.DataFrame,
-    generator_marginal_cost: float,
-    generator_capacity: float,
-    risk_aversion: float,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    risk_aversion: float | np.ndarray,
     optimisation_tolerance: float,
     initial_random_evaluations: int,
-    number_of_optimisation_iterations: int
-) -> pl.DataFrame:
-    clearing_prices_by_day = []
-    for date in forecasts[ct.ColumnNames.DATE.value].unique():
-        forecast_one_ic = forecasts.filter(pl.col(ct.ColumnNames.DATE.value) == date)
-        clearing_prices = get_results_one_day(
-            date,
-            number_of_simulations,
-            number_of_generators,
-            forecast_one_ic,
-            generator_marginal_cost,
-            generator_capacity,
-            risk_aversion,
-            optimisation_tolerance,
-            initial_random_evaluations,
-            number_of_optimisation_iterations
+    number_of_optimisation_iterations: int,
+    batched_simulations: bool = False,
+    shared_simulations: bool = False,
+    common_random_numbers: bool = False,
+    number_of_processes: int = 1,
+    random_seed: int | np.random.SeedSequence = None,
+    checkpoint_directory: str = None,
+    strategy_search_method: str = ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value,
+    search_population_size: int = 16,
+    warm_start: bool = False,
+    warm_start_box_fraction: float = 0.4,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False,
+    number_of_evaluation_processes: int = 1,
+    evaluation_batch_size: int = 1,
+    sweep_method: str = ct.SweepMethods.GAUSS_SEIDEL.value,
+    damping: float = 1.0,
+    maximum_sweeps: int = None,
+    time_budget_seconds: float = None,
+    generator_ids: list[str] = None
+) -> tuple[pl.DataFrame, pl.DataFrame]:
+    #Returns the clearing prices and every day's convergence trace, in date order
+    dates = forecasts[ct.ColumnNames.DATE.value].unique().sort().to_list()
+    #Each day gets its own child stream, so results do not depend on which process solves it or in what order
+    day_seeds = random_streams.get_seed_sequence(random_seed).spawn(len(dates))
+    
+    clearing_prices_by_date = {}
+    convergence_trace_by_date = {}
+    if checkpoint_directory is not None:
+        completed_dates = checkpoint_interaction.get_completed_dates(checkpoint_directory)
+        for date in dates:
+            if str(date) in completed_dates:
+                clearing_prices_by_date[date] = checkpoint_interaction.read_day_clearing_prices(checkpoint_directory, date)
+                convergence_trace_by_date[date] = checkpoint_interaction.read_day_convergence_trace(checkpoint_directory, date)
+        if clearing_prices_by_date:
+            print(f"Resuming from checkpoint: {len(clearing_prices_by_date)}/{len(dates)} days already calculated.")
+    
+    #Keyword arguments for get_clearing_prices_one_day, one set per day still to solve
+    day_arguments = [
+        dict(
+            date = date,
+            day_seed = day_seed,
+            number_of_simulations = number_of_simulations,
+            number_of_generators = number_of_generators,
+            forecast_one_ic = forecasts.filter(pl.col(ct.ColumnNames.DATE.value) == date),
+            generator_marginal_cost = generator_marginal_cost,
+            generator_capacity = generator_capacity,
+            risk_aversion = risk_aversion,
+            optimisation_tolerance = optimisation_tolerance,
+            initial_random_evaluations = initial_random_evaluations,
+            number_of_optimisation_iterations = number_of_optimisation_iterations,
+            batched_simulations = batched_simulations,
+            shared_simulations = shared_simulations,
+            common_random_numbers = common_random_numbers,
+            checkpoint_directory = checkpoint_directory,
+            strategy_search_method = strategy_search_method,
+            search_population_size = search_population_size,
+            warm_start_box_fraction = warm_start_box_fraction,
+            target_standard_error = target_standard_error,
+            simulation_batch_size = simulation_batch_size,
+            streaming_simulations = streaming_simulations,
+            number_of_evaluation_processes = number_of_evaluation_processes,
+            evaluation_batch_size = evaluation_batch_size,
+            sweep_method = sweep_method,
+            damping = damping,
+            maximum_sweeps = maximum_sweeps,
+            time_budget_seconds = time_budget_seconds,
+            generator_ids = generator_ids
         )
-        delivery_periods = forecast_one_ic[ct.ColumnNames.DELIVERY_PERIOD.value]
-        clearing_prices_by_day.append(clearing_prices)
-        print(f"Clearing prices for {date} calculated.")
-        
-        clearing_prices_df = pl.DataFrame(
-            {
-                ct.ColumnNames.DATE.value: [date] * len(clearing_prices),
-                ct.ColumnNames.DELIVERY_PERIOD.value: delivery_periods,
-                ct.ColumnNames.CLEARING_PRICE.value: clearing_prices
-            }
+        for date, day_seed in zip(dates, day_seeds) if date not in clearing_prices_by_date
+    ]
+    
+    #Warm-started days depend on the day before, so each process takes a contiguous block of dates
+    if warm_start and number_of_processes > 1:
+        day_blocks = [
+            [day_arguments[idx] for idx in block] for block in np.array_split(np.arange(len(day_arguments)), number_of_processes)
+            if len(block) > 0
+        ]
+    else:
+        day_blocks = [[arguments] for arguments in day_arguments]
+    days_completed = len(clearing_prices_by_date)
+    
+    if number_of_processes > 1:
+        with process_pool.get_process_pool_executor(number_of_processes) as executor:
+            futures = {}
+            for day_block in day_blocks:
+                initial_alpha_by_generator, initial_beta_by_generator = get_previous_day_strategies(
+                    day_block[0]["date"], dates, clearing_prices_by_date, checkpoint_directory, warm_start
+                )
+                future = executor.submit(
+                    get_clearing_prices_consecutive_days,
+                    day_block,
+                    warm_start,
+                    initial_alpha_by_generator,
+                    initial_beta_by_generator
+                )
+                futures[future] = day_block
+            for future in as_completed(futures):
+                clearing_prices_dfs, convergence_trace_dfs, _, _ = future.result()
+                for arguments, clearing_prices_df, convergence_trace_df in zip(futures[future], clearing_prices_dfs, convergence_trace_dfs):
+                    days_completed += 1
+                    clearing_prices_by_date[arguments["date"]] = clearing_prices_df
+                    convergence_trace_by_date[arguments["date"]] = convergence_trace_df
+                    print(f"Clearing prices for {arguments['date']} calculated ({days_completed}/{len(dates)} days).")
+    else:
+        alpha_by_generator, beta_by_generator, solved_date = None, None, None
+        for day_block in day_blocks:
+            date = day_block[0]["date"]
+            #Chain from the day just solved, or fall back to the checkpointed strategies of the day before
+            if date_before(date, dates) != solved_date:
+                alpha_by_generator, beta_by_generator = get_previous_day_strategies(
+                    date, dates, clearing_prices_by_date, checkpoint_directory, warm_start
+                )
+            clearing_prices_dfs, convergence_trace_dfs, alpha_by_generator, beta_by_generator = get_clearing_prices_consecutive_days(
+                day_block,
+                warm_start,
+                alpha_by_generator,
+                beta_by_generator
+            )
+            solved_date = date
+            days_completed += 1
+            clearing_prices_by_date[date] = clearing_prices_dfs[0]
+            convergence_trace_by_date[date] = convergence_trace_dfs[0]
+            print(f"Clearing prices for {date} calculated ({days_completed}/{len(dates)} days).")
+    
+    clearing_prices_df = pl.concat([clearing_prices_by_date[date] for date in dates])
+    #Days resumed from checkpoints written before traces were recorded have none
+    convergence_trace_dfs = [convergence_trace_by_date[date] for date in dates if convergence_trace_by_date[date] is not None]
+    convergence_trace_df = pl.concat(convergence_trace_dfs, how="vertical_relaxed") if convergence_trace_dfs else pl.DataFrame()
+    
+    return clearing_prices_df, convergence_trace_df
+
+def get_clearing_prices_consecutive_days(
+    days_arguments: list[dict],
+    warm_start: bool,
+    initial_alpha_by_generator: dict[str, float] = None,
+    initial_beta_by_generator: dict[str, float] = None
+) -> tuple[list[pl.DataFrame], list[pl.DataFrame], dict[str, float], dict[str, float]]:
+    #Solves consecutive days in order. With warm starting, each day's search is seeded with the previous day's equilibrium
+    alpha_by_generator = initial_alpha_by_generator
+    beta_by_generator = initial_beta_by_generator
+    clearing_prices_dfs = []
+    convergence_trace_dfs = []
+    for arguments in days_arguments:
+        clearing_prices_df, convergence_trace_df, alpha_by_generator, beta_by_generator = get_clearing_prices_one_day(
+            **arguments,
+            initial_alpha_by_generator = alpha_by_generator if warm_start else None,
+            initial_beta_by_generator = beta_by_generator if warm_start else None
         )
-        
-        clearing_prices_by_day.append(clearing_prices_df)
+        clearing_prices_dfs.append(clearing_prices_df)
+        convergence_trace_dfs.append(convergence_trace_df)
     
-    clearing_prices_df = pl.concat(clearing_prices_by_day)
+    return clearing_prices_dfs, convergence_trace_dfs, alpha_by_generator, beta_by_generator
+
+def get_previous_day_strategies(
+    date,
+    dates: list,
+    clearing_prices_by_date: dict,
+    checkpoint_directory: str,
+    warm_start: bool
+) -> tuple[dict[str, float], dict[str, float]]:
+    previous_date = date_before(date, dates)
+    if not warm_start or checkpoint_directory is None or previous_date not in clearing_prices_by_date:
+        return None, None
+    
+    return checkpoint_interaction.read_day_strategies(checkpoint_directory, previous_date)
+
+def date_before(
+    date,
+    dates: list
+):
+    date_idx = dates.index(date)
+    if date_idx == 0:
+        return None
+    
+    return dates[date_idx - 1]
+
+def get_clearing_prices_one_day(
+    date: str,
+    day_seed: np.random.SeedSequence,
+    number_of_simulations: int,
+    number_of_generators: int,
+    forecast_one_ic: pl.DataFrame,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    risk_aversion: float | np.ndarray,
+    optimisation_tolerance: float,
+    initial_random_evaluations: int,
+    number_of_optimisation_iterations: int,
+    batched_simulations: bool = False,
+    shared_simulations: bool = False,
+    common_random_numbers: bool = False,
+    checkpoint_directory: str = None,
+    strategy_search_method: str = ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value,
+    search_population_size: int = 16,
+    warm_start_box_fraction: float = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False,
+    number_of_evaluation_processes: int = 1,
+    evaluation_batch_size: int = 1,
+    sweep_method: str = ct.SweepMethods.GAUSS_SEIDEL.value,
+    damping: float = 1.0,
+    maximum_sweeps: int = None,
+    time_budget_seconds: float = None,
+    generator_ids: list[str] = None,
+    initial_alpha_by_generator: dict[str, float] = None,
+    initial_beta_by_generator: dict[str, float] = None
+) -> tuple[pl.DataFrame, pl.DataFrame, dict[str, float], dict[str, float]]:
+    clearing_prices, alpha_by_generator, beta_by_generator, convergence_trace_df = get_results_one_day(
+        date,
+        number_of_simulations,
+        number_of_generators,
+        forecast_one_ic,
+        generator_marginal_cost,
+        generator_capacity,
+        risk_aversion,
+        optimisation_tolerance,
+        initial_random_evaluations,
+        number_of_optimisation_iterations,
+        batched_simulations,
+        shared_simulations,
+        common_random_numbers,
+        strategy_search_method,
+        search_population_size,
+        initial_alpha_by_generator,
+        initial_beta_by_generator,
+        warm_start_box_fraction,
+        day_seed,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations,
+        number_of_evaluation_processes,
+        evaluation_batch_size,
+        sweep_method,
+        damping,
+        maximum_sweeps,
+        time_budget_seconds,
+        generator_ids
+    )
+    delivery_periods = forecast_one_ic[ct.ColumnNames.DELIVERY_PERIOD.value]
+    
+    clearing_prices_df = pl.DataFrame(
+        {
+            ct.ColumnNames.DATE.value: [date] * len(clearing_prices),
+            ct.ColumnNames.DELIVERY_PERIOD.value: delivery_periods,
+            ct.ColumnNames.CLEARING_PRICE.value: clearing_prices
+        }
+    )
+    
+    if checkpoint_directory is not None:
+        checkpoint_interaction.write_day_results(
+            checkpoint_directory,
+            date,
+            clearing_prices_df,
+            alpha_by_generator,
+            beta_by_generator,
+            convergence_trace_df
+        )
     
-    return clearing_prices_df  
+    return clearing_prices_df, convergence_trace_df, alpha_by_generator, beta_by_generator
 
 def get_results_one_day(
     date: str,
     number_of_simulations: int,
     number_of_generators: int,
     forecast_one_ic: pl.DataFrame,
-    generator_marginal_cost: float,
-    generator_capacity: float,
-    risk_aversion: float,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    risk_aversion: float | np.ndarray,
     optimisation_tolerance: float,
     initial_random_evaluations: int,
-    number_of_optimisation_iterations: int
-) -> np.ndarray:
-    br_alpha_by_generator, br_beta_by_generator = optimiser.run_optimisation_for_day(
+    number_of_optimisation_iterations: int,
+    batched_simulations: bool = False,
+    shared_simulations: bool = False,
+    common_random_numbers: bool = False,
+    strategy_search_method: str = ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value,
+    search_population_size: int = 16,
+    initial_alpha_by_generator: dict[str, float] = None,
+    initial_beta_by_generator: dict[str, float] = None,
+    warm_start_box_fraction: float = None,
+    seed_sequence: np.random.SeedSequence = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False,
+    number_of_evaluation_processes: int = 1,
+    evaluation_batch_size: int = 1,
+    sweep_method: str = ct.SweepMethods.GAUSS_SEIDEL.value,
+    damping: float = 1.0,
+    maximum_sweeps: int = None,
+    time_budget_seconds: float = None,
+    generator_ids: list[str] = None
+) -> tuple[np.ndarray, dict[str, float], dict[str, float], pl.DataFrame]:
+    optimisation_seed_sequence, auction_seed_sequence = random_streams.spawn_seed_sequences(seed_sequence, 2)
+    strategy_profile, convergence_trace_df = optimiser.run_optimisation_for_day(
         date,
         number_of_simulations,
         forecast_one_ic,
@@ -70,25 +323,39 @@ def get_results_one_day(
         risk_aversion,
         optimisation_tolerance,
         initial_random_evaluations,
-        number_of_optimisation_iterations
+        number_of_optimisation_iterations,
+        batched_simulations,
+        shared_simulations,
+        common_random_numbers,
+        strategy_search_method,
+        search_population_size,
+        initial_alpha_by_generator,
+        initial_beta_by_generator,
+        warm_start_box_fraction,
+        optimisation_seed_sequence,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations,
+        number_of_evaluation_processes,
+        evaluation_batch_size,
+        sweep_method,
+        damping,
+        maximum_sweeps,
+        time_budget_seconds,
+        generator_ids
     )
     
-    covariance_matrix_by_period = day_simulation.get_covariance_matrix_from_df(forecast_one_ic)
-    initial_generator_capacity = [generator_capacity/5 for _ in range(len(forecast_one_ic[ct.ColumnNames.DELIVERY_PERIOD.value]))]
-    initial_capacity_bids = {str(i) : initial_generator_capacity for i in range(number_of_generators)}
-    initial_capacity_bids[ct.ColumnNames.DELIVERY_PERIOD.value] = forecast_one_ic[ct.ColumnNames.DELIVERY_PERIOD.value]
-    initial_capacity_bids = pl.DataFrame(initial_capacity_bids)
+    forecast_error_sampler = day_simulation.get_forecast_error_sampler_from_df(forecast_one_ic)
     #TODO - may want to do a detrminnistic final auction here using the expectation values of the forecast, since this is what they would use
     auction_information_one_day = day_simulation.get_auction_information_one_sim(
         forecast_one_ic,
-        covariance_matrix_by_period,
+        forecast_error_sampler,
         number_of_generators,
-        br_alpha_by_generator,
-        br_beta_by_generator,
-        initial_capacity_bids,
+        strategy_profile,
         generator_marginal_cost,
+        rng = random_streams.get_batch_rng(auction_seed_sequence)
     )
     
-    auction_results, clearing_prices = auction_information_one_day.run_auction()
+    auction_results, clearing_prices = auction_information_one_day.run_auction_batch()
     
-    return clearing_prices
\ No newline at end of file
+    return clearing_prices, strategy_profile.get_alpha_by_generator(), strategy_profile.get_beta_by_generator(), convergence_trace_df
\ No newline at end of file
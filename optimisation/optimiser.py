@@ -1,110 +1,427 @@
+import time
+import itertools
 import polars as pl
 import numpy as np
 import constants as ct
 import auction_simulation.simulation_engine as simulation_engine
+import auction_simulation.strategy_profile as sp
+import auction_simulation.generator_portfolio as generator_portfolio
+import auction_simulation.random_streams as random_streams
+import optimisation.strategy_search as strategy_search
+import optimisation.process_pool as process_pool
 
-from bayes_opt import BayesianOptimization
+from enum import Enum
+from concurrent.futures import ProcessPoolExecutor
+
+default_search_bounds = {
+    'alpha': (-5, 5),
+    'beta': (0, 2)
+}
+
+evaluation_executors = {}
 
 def run_optimisation_for_day(
     date: str,
     number_of_simulations: int,
     forecast_one_ic_one_day: pl.DataFrame,
-    generator_marginal_cost: float,
-    generator_capacity: float,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
     number_of_generators: int,
-    risk_aversion: float,
+    risk_aversion: float | np.ndarray,
     optimisation_tolerance: float,
     initial_random_evaluations: int,
-    number_of_optimisation_iterations: int
-) -> np.ndarray:
-    initial_alpha = {str(i) : 0 for i in range(number_of_generators)}
-    initial_beta = {str(i) : 1 for i in range(number_of_generators)}
-    initial_generator_capacity = [generator_capacity/5 for _ in range(len(forecast_one_ic_one_day[ct.ColumnNames.DELIVERY_PERIOD.value]))]
-    initial_capacity_bids = {str(i) : initial_generator_capacity for i in range(number_of_generators)}
-    initial_capacity_bids[ct.ColumnNames.DELIVERY_PERIOD.value] = forecast_one_ic_one_day[ct.ColumnNames.DELIVERY_PERIOD.value]
-    initial_capacity_bids = pl.DataFrame(initial_capacity_bids)
+    number_of_optimisation_iterations: int,
+    batched_simulations: bool = False,
+    shared_simulations: bool = False,
+    common_random_numbers: bool = False,
+    strategy_search_method: str = ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value,
+    search_population_size: int = 16,
+    initial_alpha_by_generator: dict[str, float] = None,
+    initial_beta_by_generator: dict[str, float] = None,
+    warm_start_box_fraction: float = None,
+    seed_sequence: np.random.SeedSequence = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False,
+    number_of_evaluation_processes: int = 1,
+    evaluation_batch_size: int = 1,
+    sweep_method: str = ct.SweepMethods.GAUSS_SEIDEL.value,
+    damping: float = 1.0,
+    maximum_sweeps: int = None,
+    time_budget_seconds: float = None,
+    generator_ids: list[str] = None
+) -> tuple[sp.StrategyProfile, pl.DataFrame]:
+    #Sweeps best responses until no generator's utility moves by the tolerance. If the sweep cap or time budget
+    #runs out first, the fallback result is the profile from the sweep whose largest utility change was smallest.
+    #Either way the per-sweep convergence trace is returned alongside the profile
+    check_method(sweep_method, ct.SweepMethods, "sweep_method")
+    check_method(strategy_search_method, ct.StrategySearchMethods, "strategy_search_method")
+    
+    #One random stream for the day-wide utility evaluations and one for each generator's best response
+    common_seed_sequence, *generator_seed_sequences = random_streams.spawn_seed_sequences(seed_sequence, number_of_generators + 1)
+    is_warm_started = initial_alpha_by_generator is not None and initial_beta_by_generator is not None
+    strategy_profile = sp.get_initial_strategy_profile(
+        number_of_generators,
+        forecast_one_ic_one_day[ct.ColumnNames.DELIVERY_PERIOD.value].n_unique(),
+        generator_capacity,
+        initial_alpha_by_generator,
+        initial_beta_by_generator,
+        generator_ids
+    )
+    #A warm-started search only looks in a smaller box around each generator's seed strategy
+    search_bounds_by_generator = [
+        get_search_bounds(float(strategy_profile.alphas[i]), float(strategy_profile.betas[i]), warm_start_box_fraction)
+        if is_warm_started and warm_start_box_fraction is not None else default_search_bounds
+        for i in range(number_of_generators)
+    ]
     converged = False
-    alpha_by_generator = initial_alpha.copy()
-    beta_by_generator = initial_beta.copy()
-    bid_capacity_by_generator = initial_capacity_bids.clone()
     utility_by_generator = {str(i) : ct.NumericalConstants.DEFAULT_UTILITY.value for i in range(number_of_generators)}
+    stop_reason = None
+    number_of_sweeps = 0
+    initial_cache_statistics = simulation_engine.shared_utility_cache.get_statistics()
+    start_time = time.perf_counter()
+    sweep_records = []
+    #The symmetric search needs interchangeable generators; a mixed fleet or warm start falls back to the full asymmetric solve
+    is_symmetric_search = (
+        sweep_method == ct.SweepMethods.SYMMETRIC.value
+        and strategy_profile.is_symmetric()
+        and all(generator_portfolio.is_uniform(values) for values in (generator_marginal_cost, generator_capacity, risk_aversion))
+    )
+    if sweep_method == ct.SweepMethods.SYMMETRIC.value and not is_symmetric_search:
+        print(f"Generators for {date} are not identical, so the symmetric search falls back to Gauss-Seidel sweeps.")
     
-    while not converged:
-        for i in range(number_of_generators):
-            utility = simulation_engine.run_simulations(
-                date,
-                number_of_simulations,
-                number_of_generators,
-                forecast_one_ic_one_day,
-                alpha_by_generator,
-                beta_by_generator,
-                bid_capacity_by_generator,
-                generator_marginal_cost,
-                generator_capacity,
-                str(i),
-                risk_aversion
-            )
-        
-            new_alpha, new_beta = optimise_strategy(
-                date,
-                number_of_simulations,
-                number_of_generators,
-                alpha_by_generator,
-                beta_by_generator,
-                bid_capacity_by_generator,
-                forecast_one_ic_one_day,
-                generator_marginal_cost,
-                generator_capacity,
-                str(i),
-                risk_aversion,
-                initial_random_evaluations,
-                number_of_optimisation_iterations
+    while not converged and stop_reason is None:
+        number_of_sweeps += 1
+        sweep_start_time = time.perf_counter()
+        initial_utility_evaluations = simulation_engine.evaluation_statistics["utility_evaluations"]
+        previous_strategy_profile = strategy_profile
+        best_response_arguments = (
+            date,
+            number_of_simulations,
+            number_of_generators,
+            forecast_one_ic_one_day,
+            generator_marginal_cost,
+            generator_capacity,
+            risk_aversion,
+            initial_random_evaluations,
+            number_of_optimisation_iterations,
+            batched_simulations,
+            common_random_numbers,
+            strategy_search_method,
+            search_population_size,
+            target_standard_error,
+            simulation_batch_size,
+            streaming_simulations
+        )
+        if sweep_method == ct.SweepMethods.JACOBI.value:
+            strategy_profile = run_jacobi_sweep(
+                strategy_profile,
+                best_response_arguments,
+                search_bounds_by_generator,
+                [random_streams.get_round_seed_sequence(generator_seed_sequence, number_of_sweeps) for generator_seed_sequence in generator_seed_sequences],
+                number_of_evaluation_processes,
+                evaluation_batch_size,
+                damping
             )
-            
-            candidate_alpha_by_generator = alpha_by_generator.copy()
-            candidate_beta_by_generator = beta_by_generator.copy()
-            candidate_alpha_by_generator[str(i)] = new_alpha
-            candidate_beta_by_generator[str(i)] = new_beta
-            
-            new_utility = simulation_engine.run_simulations(
-                date,
-                number_of_simulations,
-                number_of_generators,
-                forecast_one_ic_one_day,
-                candidate_alpha_by_generator,
-                candidate_beta_by_generator,
-                bid_capacity_by_generator,
-                generator_marginal_cost,
-                generator_capacity,
-                str(i),
-                risk_aversion
+        elif is_symmetric_search:
+            #One representative generator best-responds to N-1 copies of the incumbent, then every generator adopts its response
+            new_alpha, new_beta = get_best_response(
+                strategy_profile,
+                0,
+                *best_response_arguments,
+                search_bounds_by_generator[0],
+                generator_seed_sequences[0],
+                number_of_evaluation_processes,
+                evaluation_batch_size
             )
-            
-            if new_utility > utility:
-                alpha_by_generator[str(i)] = new_alpha
-                beta_by_generator[str(i)] = new_beta
-            
+            strategy_profile = strategy_profile.with_symmetric_strategy(new_alpha, new_beta)
+        else:
+            for i in range(number_of_generators):
+                new_alpha, new_beta = get_best_response(
+                    strategy_profile,
+                    i,
+                    *best_response_arguments,
+                    search_bounds_by_generator[i],
+                    generator_seed_sequences[i],
+                    number_of_evaluation_processes,
+                    evaluation_batch_size
+                )
+                strategy_profile = strategy_profile.with_strategy(i, new_alpha, new_beta)
+        
         new_utility_by_generator = simulation_engine.get_utility_by_generator(
             date,
             number_of_simulations,
             number_of_generators,
             forecast_one_ic_one_day,
-            alpha_by_generator,
-            beta_by_generator,
-            bid_capacity_by_generator,
+            strategy_profile,
             generator_marginal_cost,
             generator_capacity,
-            risk_aversion
+            risk_aversion,
+            batched_simulations,
+            shared_simulations,
+            common_random_numbers,
+            common_seed_sequence,
+            simulation_batch_size,
+            streaming_simulations
         )
         
         utility_changes_by_generator = [new_utility_by_generator[str(i)] - utility_by_generator[str(i)] for i in range(number_of_generators)]
-            
+        sweep_end_time = time.perf_counter()
+        sweep_records.append(
+            {
+                "strategy_profile": strategy_profile,
+                "previous_strategy_profile": previous_strategy_profile,
+                "utility_by_generator": new_utility_by_generator,
+                "utility_changes_by_generator": utility_changes_by_generator,
+                "utility_evaluations": simulation_engine.evaluation_statistics["utility_evaluations"] - initial_utility_evaluations,
+                "sweep_seconds": sweep_end_time - sweep_start_time,
+                "elapsed_seconds": sweep_end_time - start_time
+            }
+        )
+        
         if all(abs(change) < optimisation_tolerance for change in utility_changes_by_generator):
              converged = True
         else:
             utility_by_generator = new_utility_by_generator.copy()
+            stop_reason = get_stop_reason(number_of_sweeps, sweep_end_time - start_time, maximum_sweeps, time_budget_seconds)
     
-    return alpha_by_generator, beta_by_generator
+    selected_sweep = number_of_sweeps
+    if not converged:
+        largest_change_by_sweep = [max(abs(change) for change in record["utility_changes_by_generator"]) for record in sweep_records]
+        selected_sweep = int(np.argmin(largest_change_by_sweep)) + 1
+        strategy_profile = sweep_records[selected_sweep - 1]["strategy_profile"]
+    
+    cache_statistics = simulation_engine.shared_utility_cache.get_statistics()
+    cache_hits = cache_statistics["hits"] - initial_cache_statistics["hits"]
+    cache_lookups = cache_hits + cache_statistics["misses"] - initial_cache_statistics["misses"]
+    if converged:
+        outcome = f"converged after {number_of_sweeps} sweeps"
+    else:
+        outcome = (
+            f"did not converge within {stop_reason}, using sweep {selected_sweep} of {number_of_sweeps}"
+            + f" (largest utility change {largest_change_by_sweep[selected_sweep - 1]:.4g})"
+        )
+    print(
+        f"Equilibrium for {date} {outcome} ({'warm' if is_warm_started else 'cold'} start"
+        + (f", {cache_hits}/{cache_lookups} utility evaluations served from cache)." if cache_lookups > 0 else ").")
+    )
+    convergence_trace_df = get_convergence_trace_df(date, sweep_records, converged, selected_sweep)
+    
+    return strategy_profile, convergence_trace_df
+
+def check_method(
+    method: str,
+    methods: type[Enum],
+    setting_name: str
+) -> None:
+    valid_methods = [valid_method.value for valid_method in methods]
+    if method not in valid_methods:
+        raise ValueError(f"Unknown {setting_name} {method!r}, expected one of {valid_methods}")
+
+def get_stop_reason(
+    number_of_sweeps: int,
+    elapsed_seconds: float,
+    maximum_sweeps: int = None,
+    time_budget_seconds: float = None
+) -> str | None:
+    if maximum_sweeps is not None and number_of_sweeps >= maximum_sweeps:
+        return f"{maximum_sweeps} sweeps"
+    if time_budget_seconds is not None and elapsed_seconds >= time_budget_seconds:
+        return f"the {time_budget_seconds}s time budget"
+    
+    return None
+
+def get_convergence_trace_df(
+    date: str,
+    sweep_records: list[dict],
+    converged: bool,
+    selected_sweep: int
+) -> pl.DataFrame:
+    #One row per sweep and generator. The strategy changes are against the profile the sweep started from
+    trace_columns = {column_name.value: [] for column_name in (
+        ct.ColumnNames.DATE,
+        ct.ColumnNames.SWEEP,
+        ct.ColumnNames.GENERATOR_ID,
+        ct.ColumnNames.ALPHA,
+        ct.ColumnNames.BETA,
+        ct.ColumnNames.ALPHA_CHANGE,
+        ct.ColumnNames.BETA_CHANGE,
+        ct.ColumnNames.UTILITY,
+        ct.ColumnNames.UTILITY_CHANGE,
+        ct.ColumnNames.UTILITY_EVALUATIONS,
+        ct.ColumnNames.SWEEP_SECONDS,
+        ct.ColumnNames.ELAPSED_SECONDS,
+        ct.ColumnNames.CONVERGED,
+        ct.ColumnNames.SELECTED
+    )}
+    for sweep_idx, record in enumerate(sweep_records):
+        strategy_profile = record["strategy_profile"]
+        previous_strategy_profile = record["previous_strategy_profile"]
+        #Utilities are keyed by position, and rows are labelled with the generators' own ids
+        for generator_idx, generator_id in enumerate(strategy_profile.get_generator_ids()):
+            trace_columns[ct.ColumnNames.DATE.value].append(date)
+            trace_columns[ct.ColumnNames.SWEEP.value].append(sweep_idx + 1)
+            trace_columns[ct.ColumnNames.GENERATOR_ID.value].append(generator_id)
+            trace_columns[ct.ColumnNames.ALPHA.value].append(float(strategy_profile.alphas[generator_idx]))
+            trace_columns[ct.ColumnNames.BETA.value].append(float(strategy_profile.betas[generator_idx]))
+            trace_columns[ct.ColumnNames.ALPHA_CHANGE.value].append(float(strategy_profile.alphas[generator_idx] - previous_strategy_profile.alphas[generator_idx]))
+            trace_columns[ct.ColumnNames.BETA_CHANGE.value].append(float(strategy_profile.betas[generator_idx] - previous_strategy_profile.betas[generator_idx]))
+            trace_columns[ct.ColumnNames.UTILITY.value].append(float(record["utility_by_generator"][str(generator_idx)]))
+            trace_columns[ct.ColumnNames.UTILITY_CHANGE.value].append(float(record["utility_changes_by_generator"][generator_idx]))
+            trace_columns[ct.ColumnNames.UTILITY_EVALUATIONS.value].append(record["utility_evaluations"])
+            trace_columns[ct.ColumnNames.SWEEP_SECONDS.value].append(record["sweep_seconds"])
+            trace_columns[ct.ColumnNames.ELAPSED_SECONDS.value].append(record["elapsed_seconds"])
+            trace_columns[ct.ColumnNames.CONVERGED.value].append(converged)
+            trace_columns[ct.ColumnNames.SELECTED.value].append(sweep_idx + 1 == selected_sweep)
+    
+    return pl.DataFrame(trace_columns)
+
+def run_jacobi_sweep(
+    strategy_profile: sp.StrategyProfile,
+    best_response_arguments: tuple,
+    search_bounds_by_generator: list[dict[str, tuple[float, float]]],
+    seed_sequence_by_generator: list[np.random.SeedSequence],
+    number_of_evaluation_processes: int = 1,
+    evaluation_batch_size: int = 1,
+    damping: float = 1.0
+) -> sp.StrategyProfile:
+    #Every generator best-responds to the same incumbent profile, so the responses are independent and can run in
+    #parallel, one generator per worker. They are then applied together, each moved only a damping fraction of the
+    #way from the incumbent strategy, which calms the oscillation simultaneous updates are prone to
+    number_of_generators = strategy_profile.number_of_generators
+    best_response_inputs = [
+        itertools.repeat(strategy_profile),
+        range(number_of_generators),
+        *[itertools.repeat(argument) for argument in best_response_arguments],
+        search_bounds_by_generator,
+        seed_sequence_by_generator,
+        #Each worker evaluates its own search serially, so pools are not nested
+        itertools.repeat(1),
+        itertools.repeat(evaluation_batch_size)
+    ]
+    if number_of_evaluation_processes > 1:
+        best_responses = map_in_workers(number_of_evaluation_processes, get_best_response, *best_response_inputs)
+    else:
+        best_responses = list(map(get_best_response, *best_response_inputs))
+    
+    best_response_alphas, best_response_betas = np.array(best_responses).T
+    damped_strategy_profile = sp.StrategyProfile(
+        strategy_profile.alphas + damping * (best_response_alphas - strategy_profile.alphas),
+        strategy_profile.betas + damping * (best_response_betas - strategy_profile.betas),
+        strategy_profile.capacity_bids,
+        strategy_profile.generator_ids
+    )
+    
+    return damped_strategy_profile
+
+def get_best_response(
+    strategy_profile: sp.StrategyProfile,
+    generator_idx: int,
+    date: str,
+    number_of_simulations: int,
+    number_of_generators: int,
+    forecast_one_ic_one_day: pl.DataFrame,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    risk_aversion: float | np.ndarray,
+    initial_random_evaluations: int,
+    number_of_optimisation_iterations: int,
+    batched_simulations: bool,
+    common_random_numbers: bool,
+    strategy_search_method: str,
+    search_population_size: int,
+    target_standard_error: float,
+    simulation_batch_size: int,
+    streaming_simulations: bool,
+    search_bounds: dict[str, tuple[float, float]],
+    seed_sequence: np.random.SeedSequence = None,
+    number_of_evaluation_processes: int = 1,
+    evaluation_batch_size: int = 1
+) -> tuple[float, float]:
+    #The searched strategy if it beats the generator's current one against the rest of the profile, else the current one
+    utility = simulation_engine.run_simulations(
+        date,
+        number_of_simulations,
+        number_of_generators,
+        forecast_one_ic_one_day,
+        strategy_profile,
+        generator_marginal_cost,
+        generator_capacity,
+        str(generator_idx),
+        risk_aversion,
+        batched_simulations,
+        common_random_numbers,
+        seed_sequence,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations
+    )
+    
+    new_alpha, new_beta = optimise_strategy(
+        date,
+        number_of_simulations,
+        number_of_generators,
+        strategy_profile,
+        forecast_one_ic_one_day,
+        generator_marginal_cost,
+        generator_capacity,
+        str(generator_idx),
+        risk_aversion,
+        initial_random_evaluations,
+        number_of_optimisation_iterations,
+        batched_simulations,
+        common_random_numbers,
+        strategy_search_method,
+        search_population_size,
+        search_bounds,
+        seed_sequence,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations,
+        number_of_evaluation_processes,
+        evaluation_batch_size
+    )
+    
+    candidate_strategy_profile = strategy_profile.with_strategy(generator_idx, new_alpha, new_beta)
+    
+    new_utility = simulation_engine.run_simulations(
+        date,
+        number_of_simulations,
+        number_of_generators,
+        forecast_one_ic_one_day,
+        candidate_strategy_profile,
+        generator_marginal_cost,
+        generator_capacity,
+        str(generator_idx),
+        risk_aversion,
+        batched_simulations,
+        common_random_numbers,
+        seed_sequence,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations
+    )
+    
+    if new_utility > utility:
+        return new_alpha, new_beta
+    
+    return float(strategy_profile.alphas[generator_idx]), float(strategy_profile.betas[generator_idx])
+
+def get_search_bounds(
+    seed_alpha: float,
+    seed_beta: float,
+    box_fraction: float
+) -> dict[str, tuple[float, float]]:
+    search_bounds = {}
+    for parameter, seed in (('alpha', seed_alpha), ('beta', seed_beta)):
+        lower_bound, upper_bound = default_search_bounds[parameter]
+        half_width = box_fraction * (upper_bound - lower_bound) / 2
+        search_bounds[parameter] = (
+            max(seed - half_width, lower_bound),
+            min(seed + half_width, upper_bound)
+        )
+    
+    return search_bounds
 
 #For now, only optimising the values alpha and beta, assuming a fixed capacity bid into the auction. May relax this later
 def objective_function(
@@ -114,60 +431,292 @@ def objective_function(
     number_of_simulations: int,
     number_of_generators: int,
     forecast_one_ic: pl.DataFrame,
-    generator_marginal_cost: float,
-    generator_capacity: float,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
     generator_id: str,
-    risk_aversion: float,
-    alpha_by_generator: dict[int, float],
-    beta_by_generator: dict[int, float],
-    bid_capacity_by_generator : pl.DataFrame
+    risk_aversion: float | np.ndarray,
+    strategy_profile: sp.StrategyProfile,
+    batched_simulations: bool = False,
+    common_random_numbers: bool = False,
+    seed_sequence: np.random.SeedSequence = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False
 ) -> float:
-    candidate_alpha_by_generator = alpha_by_generator.copy()
-    candidate_beta_by_generator = beta_by_generator.copy()
-    candidate_alpha_by_generator[generator_id] = alpha
-    candidate_beta_by_generator[generator_id] = beta
+    candidate_strategy_profile = strategy_profile.with_strategy(int(generator_id), alpha, beta)
     
     utility = simulation_engine.run_simulations(
         date,
         number_of_simulations,
         number_of_generators,
         forecast_one_ic,
-        candidate_alpha_by_generator,
-        candidate_beta_by_generator,
-        bid_capacity_by_generator,
+        candidate_strategy_profile,
         generator_marginal_cost,
         generator_capacity,
         generator_id,
-        risk_aversion
+        risk_aversion,
+        batched_simulations,
+        common_random_numbers,
+        seed_sequence,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations
     )
     
     return utility  #BayesianOptimization maxmises the objective
-        
+
+def batch_objective_function(
+    candidate_alphas: np.ndarray,
+    candidate_betas: np.ndarray,
+    date: str,
+    number_of_simulations: int,
+    number_of_generators: int,
+    forecast_one_ic: pl.DataFrame,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    generator_id: str,
+    risk_aversion: float | np.ndarray,
+    strategy_profile: sp.StrategyProfile,
+    batched_simulations: bool = False,
+    common_random_numbers: bool = False,
+    seed_sequence: np.random.SeedSequence = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False
+) -> np.ndarray:
+    utility_by_candidate = simulation_engine.run_simulations_for_candidates(
+        date,
+        number_of_simulations,
+        number_of_generators,
+        forecast_one_ic,
+        strategy_profile,
+        generator_marginal_cost,
+        generator_capacity,
+        generator_id,
+        risk_aversion,
+        candidate_alphas,
+        candidate_betas,
+        batched_simulations,
+        common_random_numbers,
+        seed_sequence,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations
+    )
+    
+    return utility_by_candidate
+
+def evaluate_strategies(
+    candidate_alphas: np.ndarray,
+    candidate_betas: np.ndarray,
+    date: str,
+    number_of_simulations: int,
+    number_of_generators: int,
+    forecast_one_ic: pl.DataFrame,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
+    generator_id: str,
+    risk_aversion: float | np.ndarray,
+    strategy_profile: sp.StrategyProfile,
+    batched_simulations: bool = False,
+    common_random_numbers: bool = False,
+    seed_sequence: np.random.SeedSequence = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False,
+    number_of_evaluation_processes: int = 1
+) -> np.ndarray:
+    #Full Monte Carlo evaluations of independent candidates, spread over a worker pool. With common random numbers
+    #every candidate uses the same stream, as in the one-at-a-time search; otherwise each gets its own child stream,
+    #so the result does not depend on the number of workers
+    number_of_candidates = len(candidate_alphas)
+    if common_random_numbers:
+        candidate_seed_sequences = [seed_sequence] * number_of_candidates
+    else:
+        candidate_seed_sequences = random_streams.spawn_seed_sequences(seed_sequence, number_of_candidates)
+    objective_arguments = [
+        candidate_alphas.tolist(),
+        candidate_betas.tolist(),
+        *[
+            itertools.repeat(argument) for argument in (
+                date,
+                number_of_simulations,
+                number_of_generators,
+                forecast_one_ic,
+                generator_marginal_cost,
+                generator_capacity,
+                generator_id,
+                risk_aversion,
+                strategy_profile,
+                batched_simulations,
+                common_random_numbers
+            )
+        ],
+        candidate_seed_sequences,
+        itertools.repeat(target_standard_error),
+        itertools.repeat(simulation_batch_size),
+        itertools.repeat(streaming_simulations)
+    ]
+    
+    if number_of_evaluation_processes <= 1 or number_of_candidates <= 1:
+        return np.array(list(map(objective_function, *objective_arguments)))
+    
+    utility_by_candidate = np.array(map_in_workers(number_of_evaluation_processes, objective_function, *objective_arguments))
+    
+    #Workers have their own caches, so keep their results here for the re-evaluation of the chosen strategy
+    settings = simulation_engine.get_run_simulations_settings(
+        number_of_simulations,
+        number_of_generators,
+        generator_marginal_cost,
+        generator_capacity,
+        generator_id,
+        risk_aversion,
+        batched_simulations,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations
+    )
+    for alpha, beta, candidate_seed_sequence, utility in zip(candidate_alphas, candidate_betas, candidate_seed_sequences, utility_by_candidate):
+        cache_key = simulation_engine.get_utility_cache_key(
+            date,
+            forecast_one_ic,
+            strategy_profile.with_strategy(int(generator_id), alpha, beta),
+            settings,
+            common_random_numbers,
+            candidate_seed_sequence
+        )
+        if cache_key is not None:
+            simulation_engine.shared_utility_cache.put(cache_key, float(utility))
+    
+    return utility_by_candidate
+
+def get_evaluation_executor(number_of_processes: int) -> ProcessPoolExecutor:
+    #One pool per process, created on first use and kept for every later search
+    if number_of_processes not in evaluation_executors:
+        evaluation_executors[number_of_processes] = process_pool.get_process_pool_executor(number_of_processes)
+    
+    return evaluation_executors[number_of_processes]
+
+def map_in_workers(
+    number_of_processes: int,
+    function,
+    *arguments
+) -> list:
+    #Maps over the worker pool and adds the workers' utility evaluations to this process's count
+    results_and_evaluations = list(get_evaluation_executor(number_of_processes).map(
+        count_utility_evaluations,
+        itertools.repeat(function),
+        *arguments
+    ))
+    simulation_engine.evaluation_statistics["utility_evaluations"] += sum(evaluations for _, evaluations in results_and_evaluations)
+    
+    return [result for result, _ in results_and_evaluations]
+
+def count_utility_evaluations(
+    function,
+    *arguments
+) -> tuple:
+    initial_utility_evaluations = simulation_engine.evaluation_statistics["utility_evaluations"]
+    result = function(*arguments)
+    
+    return result, simulation_engine.evaluation_statistics["utility_evaluations"] - initial_utility_evaluations
+
 def optimise_strategy(
     date: str,
     number_of_simulations: int,
     number_of_generators: int,
-    alpha_by_generator: dict[str, float],
-    beta_by_generator: dict[str, float],
-    bid_capacity_by_generator: pl.DataFrame,
+    strategy_profile: sp.StrategyProfile,
     forecast_one_ic: pl.DataFrame,
-    generator_marginal_cost: float,
-    generator_capacity: float,
+    generator_marginal_cost: float | np.ndarray,
+    generator_capacity: float | np.ndarray,
     generator_id: str,
-    risk_aversion: float,
+    risk_aversion: float | np.ndarray,
     initial_random_evaluations: int,
-    number_of_optimisation_iterations: int
+    number_of_optimisation_iterations: int,
+    batched_simulations: bool = False,
+    common_random_numbers: bool = False,
+    strategy_search_method: str = ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value,
+    search_population_size: int = 16,
+    pbounds: dict[str, tuple[float, float]] = None,
+    seed_sequence: np.random.SeedSequence = None,
+    target_standard_error: float = None,
+    simulation_batch_size: int = 100,
+    streaming_simulations: bool = False,
+    number_of_evaluation_processes: int = 1,
+    evaluation_batch_size: int = 1
 ) -> tuple[float, float]:
     
-    pbounds = {
-        'alpha': (-5, 5),
-        'beta': (0, 2)
-    }
+    if pbounds is None:
+        pbounds = default_search_bounds
+    
+    is_parallel_bayesian_optimisation = number_of_evaluation_processes > 1 or evaluation_batch_size > 1
+    if strategy_search_method == ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value and is_parallel_bayesian_optimisation:
+        def bo_batch_objective(candidate_alphas, candidate_betas):
+            return evaluate_strategies(
+                candidate_alphas,
+                candidate_betas,
+                date,
+                number_of_simulations,
+                number_of_generators,
+                forecast_one_ic,
+                generator_marginal_cost,
+                generator_capacity,
+                generator_id,
+                risk_aversion,
+                strategy_profile,
+                batched_simulations,
+                common_random_numbers,
+                seed_sequence,
+                target_standard_error,
+                simulation_batch_size,
+                streaming_simulations,
+                number_of_evaluation_processes
+            )
+        
+        return strategy_search.search_batch_bayesian_optimisation(
+            bo_batch_objective,
+            pbounds,
+            initial_random_evaluations,
+            number_of_optimisation_iterations,
+            evaluation_batch_size,
+            random_streams.get_random_state(seed_sequence)
+        )
+    
+    if strategy_search_method == ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value:
+        def bo_objective(alpha, beta):
+            return objective_function(
+                alpha,
+                beta,
+                date,
+                number_of_simulations,
+                number_of_generators,
+                forecast_one_ic,
+                generator_marginal_cost,
+                generator_capacity,
+                generator_id,
+                risk_aversion,
+                strategy_profile,
+                batched_simulations,
+                common_random_numbers,
+                seed_sequence,
+                target_standard_error,
+                simulation_batch_size,
+                streaming_simulations
+            )
+        
+        return strategy_search.search_bayesian_optimisation(
+            bo_objective,
+            pbounds,
+            initial_random_evaluations,
+            number_of_optimisation_iterations,
+            random_streams.get_random_state(seed_sequence)
+        )
     
-    def bo_objective(alpha, beta):
-        return objective_function(
-            alpha,
-            beta,
+    #Population-based searches score every candidate in a generation with one vectorised simulation
+    def batch_objective(candidate_alphas, candidate_betas):
+        return batch_objective_function(
+            candidate_alphas,
+            candidate_betas,
             date,
             number_of_simulations,
             number_of_generators,
@@ -176,26 +725,22 @@ def optimise_strategy(
             generator_capacity,
             generator_id,
             risk_aversion,
-            alpha_by_generator,
-            beta_by_generator,
-            bid_capacity_by_generator
+            strategy_profile,
+            batched_simulations,
+            common_random_numbers,
+            seed_sequence,
+            target_standard_error,
+            simulation_batch_size,
+            streaming_simulations
         )
-        
-    optimizer = BayesianOptimization(
-        f=bo_objective,
-        pbounds=pbounds,
-        random_state=42,
-        verbose=1
-    )
     
-    optimizer.maximize(
-        init_points=initial_random_evaluations,
-        n_iter=number_of_optimisation_iterations
+    search_function = strategy_search.batch_search_methods[strategy_search_method]
+    best_alpha, best_beta = search_function(
+        batch_objective,
+        pbounds,
+        search_population_size,
+        number_of_optimisation_iterations,
+        random_streams.get_random_state(seed_sequence)
     )
     
-    best_params = optimizer.max['params']
-    best_alpha = best_params['alpha']
-    best_beta = best_params['beta']
-    
-    return best_alpha, best_beta
-        
\ No newline at end of file
+    return best_alpha, best_beta
\ No newline at end of file
@@ -0,0 +1,10 @@
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+
+def get_process_pool_executor(number_of_processes: int) -> ProcessPoolExecutor:
+    #Spawn rather than fork, since Polars' thread pool is not fork-safe
+    return ProcessPoolExecutor(
+        max_workers=number_of_processes,
+        mp_context=multiprocessing.get_context("spawn")
+    )
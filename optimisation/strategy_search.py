@@ -0,0 +1,219 @@
+import numpy as np
+import constants as ct
+
+from bayes_opt import BayesianOptimization
+
+#Each search takes an objective over (alpha, beta) and the search box, and returns the best (alpha, beta) found.
+#The Bayesian optimisation search scores one point at a time; the others score a whole population of
+#candidates per call, so that a single vectorised simulation (or a pool of workers) evaluates many strategies at once
+
+def search_bayesian_optimisation(
+    objective,
+    pbounds: dict[str, tuple[float, float]],
+    initial_random_evaluations: int,
+    number_of_optimisation_iterations: int,
+    random_state: int = 42
+) -> tuple[float, float]:
+    optimizer = BayesianOptimization(
+        f=objective,
+        pbounds=pbounds,
+        random_state=random_state,
+        verbose=1
+    )
+    
+    optimizer.maximize(
+        init_points=initial_random_evaluations,
+        n_iter=number_of_optimisation_iterations
+    )
+    
+    best_params = optimizer.max['params']
+    best_alpha = best_params['alpha']
+    best_beta = best_params['beta']
+    
+    return best_alpha, best_beta
+
+def search_batch_bayesian_optimisation(
+    batch_objective,
+    pbounds: dict[str, tuple[float, float]],
+    initial_random_evaluations: int,
+    number_of_optimisation_iterations: int,
+    evaluation_batch_size: int = 1,
+    random_state: int = 42
+) -> tuple[float, float]:
+    #Bayesian optimisation that hands the objective a batch of points at a time, so they can be scored in parallel.
+    #The initial random design is one batch. Each later batch of evaluation_batch_size points is proposed with the
+    #constant liar heuristic: every proposal is registered with the worst utility seen so far before the next is
+    #suggested, which pushes the rest of the batch away from it
+    optimizer = BayesianOptimization(
+        f=None,
+        pbounds=pbounds,
+        random_state=random_state,
+        verbose=0,
+        allow_duplicate_points=True
+    )
+    rng = np.random.RandomState(random_state)
+    register_batch(optimizer, optimizer.random_sample(max(initial_random_evaluations, 1)), batch_objective)
+    
+    remaining_iterations = number_of_optimisation_iterations
+    while remaining_iterations > 0:
+        batch_size = min(max(evaluation_batch_size, 1), remaining_iterations)
+        batch_optimizer = BayesianOptimization(
+            f=None,
+            pbounds=pbounds,
+            random_state=rng.randint(np.iinfo(np.int32).max),
+            verbose=0,
+            allow_duplicate_points=True
+        )
+        for result in optimizer.res:
+            batch_optimizer.register(result['params'], result['target'])
+        lie = min(result['target'] for result in optimizer.res)
+        
+        proposals = []
+        for _ in range(batch_size):
+            proposal = batch_optimizer.suggest()
+            proposals.append(proposal)
+            batch_optimizer.register(proposal, lie)
+        register_batch(optimizer, proposals, batch_objective)
+        remaining_iterations -= batch_size
+    
+    best_params = optimizer.max['params']
+    best_alpha = best_params['alpha']
+    best_beta = best_params['beta']
+    
+    return best_alpha, best_beta
+
+def register_batch(
+    optimizer: BayesianOptimization,
+    proposals: list[dict[str, float]],
+    batch_objective
+) -> None:
+    candidate_alphas = np.array([float(proposal['alpha']) for proposal in proposals])
+    candidate_betas = np.array([float(proposal['beta']) for proposal in proposals])
+    utilities = batch_objective(candidate_alphas, candidate_betas)
+    for proposal, utility in zip(proposals, utilities):
+        optimizer.register(proposal, float(utility))
+
+def search_grid(
+    batch_objective,
+    pbounds: dict[str, tuple[float, float]],
+    population_size: int,
+    number_of_generations: int,
+    random_state: int = None
+) -> tuple[float, float]:
+    #Evaluates a grid over the search box, then repeatedly zooms in to one grid step either side of the best point.
+    #The grid is deterministic, so random_state is only accepted to match the other batch searches
+    lower_bounds, upper_bounds = get_bounds_arrays(pbounds)
+    points_per_axis = max(int(np.sqrt(population_size)), 2)
+    current_lower_bounds = lower_bounds.copy()
+    current_upper_bounds = upper_bounds.copy()
+    best_candidate = None
+    best_utility = -np.inf
+    
+    for _ in range(max(number_of_generations, 1)):
+        alpha_grid, beta_grid = np.meshgrid(
+            np.linspace(current_lower_bounds[0], current_upper_bounds[0], points_per_axis),
+            np.linspace(current_lower_bounds[1], current_upper_bounds[1], points_per_axis)
+        )
+        candidates = np.column_stack([alpha_grid.ravel(), beta_grid.ravel()])
+        utilities = batch_objective(candidates[:, 0], candidates[:, 1])
+        
+        best_idx = np.argmax(utilities)
+        if utilities[best_idx] > best_utility:
+            best_utility = utilities[best_idx]
+            best_candidate = candidates[best_idx]
+        
+        grid_step = (current_upper_bounds - current_lower_bounds) / (points_per_axis - 1)
+        current_lower_bounds = np.maximum(best_candidate - grid_step, lower_bounds)
+        current_upper_bounds = np.minimum(best_candidate + grid_step, upper_bounds)
+    
+    return best_candidate[0], best_candidate[1]
+
+def search_cma_es(
+    batch_objective,
+    pbounds: dict[str, tuple[float, float]],
+    population_size: int,
+    number_of_generations: int,
+    random_state: int = 42
+) -> tuple[float, float]:
+    #(mu/mu_w, lambda)-CMA-ES on the search box rescaled to the unit square, with candidates clipped to the box
+    rng = np.random.default_rng(random_state)
+    lower_bounds, upper_bounds = get_bounds_arrays(pbounds)
+    dimensions = len(lower_bounds)
+    population_size = max(population_size, 4)
+    number_of_parents = population_size // 2
+    
+    weights = np.log(number_of_parents + 0.5) - np.log(np.arange(1, number_of_parents + 1))
+    weights = weights / weights.sum()
+    effective_parents = 1 / (weights ** 2).sum()
+    
+    cumulation_c = (4 + effective_parents / dimensions) / (dimensions + 4 + 2 * effective_parents / dimensions)
+    cumulation_sigma = (effective_parents + 2) / (dimensions + effective_parents + 5)
+    rank_one_rate = 2 / ((dimensions + 1.3) ** 2 + effective_parents)
+    rank_mu_rate = min(
+        1 - rank_one_rate,
+        2 * (effective_parents - 2 + 1 / effective_parents) / ((dimensions + 2) ** 2 + effective_parents)
+    )
+    sigma_damping = 1 + 2 * max(0, np.sqrt((effective_parents - 1) / (dimensions + 1)) - 1) + cumulation_sigma
+    expected_norm = np.sqrt(dimensions) * (1 - 1 / (4 * dimensions) + 1 / (21 * dimensions ** 2))
+    
+    mean = np.full(dimensions, 0.5)
+    sigma = 0.3
+    covariance = np.eye(dimensions)
+    path_c = np.zeros(dimensions)
+    path_sigma = np.zeros(dimensions)
+    best_candidate = None
+    best_utility = -np.inf
+    
+    for generation in range(max(number_of_generations, 1)):
+        eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+        axis_lengths = np.sqrt(np.maximum(eigenvalues, 1e-20))
+        steps = rng.standard_normal((population_size, dimensions)) @ (eigenvectors * axis_lengths).T
+        unit_candidates = np.clip(mean + sigma * steps, 0, 1)
+        candidates = lower_bounds + unit_candidates * (upper_bounds - lower_bounds)
+        utilities = batch_objective(candidates[:, 0], candidates[:, 1])
+        
+        best_idx = np.argmax(utilities)
+        if utilities[best_idx] > best_utility:
+            best_utility = utilities[best_idx]
+            best_candidate = candidates[best_idx]
+        
+        parent_steps = (unit_candidates[np.argsort(-utilities)[:number_of_parents]] - mean) / sigma
+        weighted_step = weights @ parent_steps
+        mean = mean + sigma * weighted_step
+        
+        inverse_sqrt_covariance = eigenvectors @ np.diag(1 / axis_lengths) @ eigenvectors.T
+        path_sigma = (1 - cumulation_sigma) * path_sigma + np.sqrt(
+            cumulation_sigma * (2 - cumulation_sigma) * effective_parents
+        ) * inverse_sqrt_covariance @ weighted_step
+        path_sigma_norm = np.linalg.norm(path_sigma)
+        is_path_short = path_sigma_norm / np.sqrt(
+            1 - (1 - cumulation_sigma) ** (2 * (generation + 1))
+        ) / expected_norm < 1.4 + 2 / (dimensions + 1)
+        path_c = (1 - cumulation_c) * path_c + is_path_short * np.sqrt(
+            cumulation_c * (2 - cumulation_c) * effective_parents
+        ) * weighted_step
+        
+        covariance = (
+            (1 - rank_one_rate - rank_mu_rate) * covariance
+            + rank_one_rate * (
+                np.outer(path_c, path_c)
+                + (1 - is_path_short) * cumulation_c * (2 - cumulation_c) * covariance
+            )
+            + rank_mu_rate * (parent_steps.T * weights) @ parent_steps
+        )
+        sigma = sigma * np.exp((cumulation_sigma / sigma_damping) * (path_sigma_norm / expected_norm - 1))
+    
+    return best_candidate[0], best_candidate[1]
+
+def get_bounds_arrays(
+    pbounds: dict[str, tuple[float, float]]
+) -> tuple[np.ndarray, np.ndarray]:
+    lower_bounds = np.array([pbounds['alpha'][0], pbounds['beta'][0]], dtype=np.float64)
+    upper_bounds = np.array([pbounds['alpha'][1], pbounds['beta'][1]], dtype=np.float64)
+    
+    return lower_bounds, upper_bounds
+
+batch_search_methods = {
+    ct.StrategySearchMethods.GRID.value: search_grid,
+    ct.StrategySearchMethods.CMA_ES.value: search_cma_es
+}
@@ -1,4 +1,5 @@
 import model.engine as engine
+import constants as ct
 
 read_in_filepath = '/Users/josephcary/Library/CloudStorage/OneDrive-Nexus365/First Year/Papers/Interconnection/Raw Data/One Year Test.xlsx'
 rolling_window_days = 30
@@ -10,6 +11,27 @@ risk_aversion = 1
 optimisation_tolerance = 0.1
 initial_random_evaluations = 10
 number_of_optimisation_iterations = 10
+batched_simulations = False
+shared_simulations = False
+common_random_numbers = False
+number_of_processes = 1
+random_seed = None
+number_of_interconnector_processes = 1
+strategy_search_method = ct.StrategySearchMethods.BAYESIAN_OPTIMISATION.value
+search_population_size = 16
+warm_start = False
+warm_start_box_fraction = 0.4
+target_standard_error = None  #None simulates exactly number_of_simulations; otherwise that number is the cap
+simulation_batch_size = 100
+streaming_simulations = False
+number_of_evaluation_processes = 1
+evaluation_batch_size = 1
+sweep_method = ct.SweepMethods.GAUSS_SEIDEL.value
+damping = 1.0
+maximum_sweeps = None  #None sweeps until the equilibrium converges
+time_budget_seconds = None
+generator_portfolio_filepath = None  #A table of generator_id, marginal_cost, capacity and risk_aversion that overrides the generator settings above
+checkpoint_directory = None  #A directory to save each finished day to, so an interrupted run can resume
 output_filepath = '/Users/josephcary/Library/CloudStorage/OneDrive-Nexus365/First Year/Papers/Interconnection/Code Testing/BO Test.xlsx'
 
 def main():
@@ -24,7 +46,29 @@ def main():
         optimisation_tolerance,
         initial_random_evaluations,
         number_of_optimisation_iterations,
-        output_filepath
+        output_filepath,
+        batched_simulations,
+        shared_simulations,
+        common_random_numbers,
+        number_of_processes,
+        random_seed,
+        number_of_interconnector_processes,
+        checkpoint_directory,
+        strategy_search_method,
+        search_population_size,
+        warm_start,
+        warm_start_box_fraction,
+        target_standard_error,
+        simulation_batch_size,
+        streaming_simulations,
+        number_of_evaluation_processes,
+        evaluation_batch_size,
+        sweep_method,
+        damping,
+        maximum_sweeps,
+        time_budget_seconds,
+        generator_portfolio_filepath
     )
      
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
\ No newline at end of file